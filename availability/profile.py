@@ -11,13 +11,25 @@ will most likely instantiate :py:func:`DiscreteProfile` and
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Tuple, Hashable, List, Callable, AnyStr, Any
+from typing import (
+    Generic,
+    TypeVar,
+    Tuple,
+    Hashable,
+    List,
+    Callable,
+    AnyStr,
+    Any,
+    Iterable,
+    Type,
+    Dict,
+)
+from bisect import bisect_right
 from dataclasses import dataclass
 from operator import attrgetter
-import copy
 from sortedcontainers import SortedKeyList
 from .sets import DiscreteSet, ContinuousSet, DiscreteRange, ContinuousRange
-from .util import ABCComparator, IntFloatComparator
+from .util import ABCComparator, IntFloatComparator, IntegerComparator
 
 
 __all__ = [
@@ -32,6 +44,9 @@ __all__ = [
 C = TypeVar("C", DiscreteSet, ContinuousSet, None)  # content type
 T = TypeVar("T", int, float)  # time type
 
+# The number of queries whose slots a profile keeps until it changes
+_SLOTS_CACHE_SIZE = 64
+
 
 @dataclass
 class TimeSlot(Generic[T, C]):
@@ -53,7 +68,7 @@ class TimeSlot(Generic[T, C]):
     """ The resources available during the period. """
 
 
-@dataclass
+@dataclass(init=False)
 class ProfileEntry(Generic[T, C], Hashable):
     """
     A profile entry.
@@ -62,18 +77,29 @@ class ProfileEntry(Generic[T, C], Hashable):
     change in resources and the `set` of available resources.
     """
 
+    __slots__ = ["time", "resources", "num_units"]
+
     time: T
     """ The time of the entry. """
     resources: C
     """ The resource set available at the time. """
-    num_units: int = 1
+    num_units: int
     """ 
     The number of jobs/work units that use this entry to
     mark either their start or end time. 
     """
 
+    # The default number of units is set here, as a default value
+    # in the class would conflict with the slot of the field
+    def __init__(self, time: T, resources: C, num_units: int = 1):
+        self.time = time
+        self.resources = resources
+        self.num_units = num_units
+
+    # Only the time is hashed, which is cheaper than caching the hash in
+    # another slot and cannot go stale if the time of the entry changes
     def __hash__(self):
-        return self.time.__hash__()
+        return hash(self.time)
 
     @classmethod
     def make(cls, time: T, resources: C = None) -> ProfileEntry[T, C]:
@@ -100,10 +126,11 @@ class ProfileEntry(Generic[T, C], Hashable):
             A copy of this entry.
         """
         time_used = self.time if time is None else time
-        return ProfileEntry(time=time_used, resources=copy.copy(self.resources))
+        resources = None if self.resources is None else self.resources.copy()
+        return ProfileEntry(time_used, resources)
 
     def __copy__(self):
-        return ProfileEntry(time=self.time, resources=copy.copy(self.resources))
+        return self.copy()
 
 
 class ABCProfile(ABC, Generic[T, C]):
@@ -116,20 +143,23 @@ class ABCProfile(ABC, Generic[T, C]):
     the specific time.
     """
 
-    _max_capacity: T
-    """ The maximum resource capacity at any given time. """
+    _max_capacity: T | None
+    """ The maximum resource capacity at any given time, if known. """
     _comp: ABCComparator[T]
     """ Comparator to compare times and quantities (they may be floats). """
     _avail: SortedKeyList[ProfileEntry[T, C]]
     """ The data structure used to store the availability information. """
+    _slots_cache: Dict[Tuple, List[TimeSlot[T, C]]]
+    """ The slots last computed for each query, until the profile changes. """
 
     def __init__(self, **kwargs):
-        self._max_capacity = kwargs.get("max_capacity", 0)
+        self._max_capacity = kwargs.get("max_capacity", None)
         if "comparator" not in kwargs:
             raise ValueError("Comparator needed to compare time and quantities")
 
         self._comp = kwargs.get("comparator", None)
         self._avail = SortedKeyList(key=self.key_by_time())
+        self._slots_cache = {}
 
     @staticmethod
     def key_by_time() -> Callable[[AnyStr], Any]:
@@ -151,18 +181,36 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             None
         """
+        self._slots_cache.clear()
         self._avail.add(entry)
 
     @property
-    def max_capacity(self) -> T:
+    def max_capacity(self) -> T | None:
         """
         Obtains the maximum resource capacity of this profile.
 
         Returns:
-            The maximum capacity
+            The maximum capacity or None if it was not given
         """
         return self._max_capacity
 
+    def _exceeds_capacity(self, quantity: T) -> bool:
+        """
+        Checks whether a quantity exceeds the maximum capacity of this profile.
+
+        No entry holds more resources than the capacity, so requests for
+        more resources can be rejected without checking the entries.
+
+        Args:
+            quantity: the amount of resources required.
+
+        Returns:
+            True if the capacity was given and the quantity exceeds it.
+        """
+        return self._max_capacity is not None and not self._comp.value_le(
+            quantity, self._max_capacity
+        )
+
     @staticmethod
     @abstractmethod
     def make_slot(start_time: T, end_time: T, resources: C) -> TimeSlot[T, C]:
@@ -190,12 +238,10 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             the index and value found at the searched position
         """
-        index: int = self._avail.bisect_right(ProfileEntry.make(value)) - 1
+        index: int = self._avail.bisect_key_right(value) - 1
         return index, None if index < 0 else self._avail[index]
 
-    def _clone_availability(
-        self, start_time: T, end_time: T
-    ) -> SortedKeyList[ProfileEntry]:
+    def _clone_availability(self, start_time: T, end_time: T) -> List[ProfileEntry]:
         """
         Returns a shallow copy of the availability structure
         between the provided time interval.
@@ -205,17 +251,16 @@ class ABCProfile(ABC, Generic[T, C]):
             end_time: the end time
 
         Returns:
-            A shallow copy of the structure with the availability information
+            A time-ordered list with copies of the entries in the interval
         """
         idx, _ = self._find_place_before(start_time)
-        cloned: SortedKeyList[ProfileEntry] = SortedKeyList(key=self.key_by_time())
+        cloned: List[ProfileEntry] = []
+        value_gt = self._comp.value_gt
 
-        while idx < len(self._avail):
-            entry: ProfileEntry = self._avail[idx]
-            if self._comp.value_gt(entry.time, end_time):
+        for entry in self._avail.islice(max(idx, 0)):
+            if value_gt(entry.time, end_time):
                 break
-            cloned.add(copy.copy(entry))
-            idx += 1
+            cloned.append(entry.copy())
 
         return cloned
 
@@ -232,7 +277,42 @@ class ABCProfile(ABC, Generic[T, C]):
         """
         index, _ = self._find_place_before(earliest_time)
         if index > 0:
-            self._avail = self._avail[index:]
+            self._slots_cache.clear()
+            del self._avail[:index]
+
+    @staticmethod
+    def _intersect_until(
+        entry: ProfileEntry[T, C],
+        following: Iterable[ProfileEntry[T, C]],
+        quantity: T,
+        end_time: T,
+    ) -> C | None:
+        """
+        Intersects the resources of an entry with those of the entries that follow.
+
+        Args:
+            entry: the entry at the start of the interval.
+            following: the entries after `entry`, in time order.
+            quantity: the amount of resources required.
+            end_time: the end of the interval.
+
+        Returns:
+            The resources available from the entry's time until the end time
+            or None if they are fewer than the quantity required.
+        """
+        resources: C = entry.resources
+        for next_entry in following:
+            if resources.quantity < quantity or next_entry.time >= end_time:
+                break
+            resources = resources & next_entry.resources
+
+        # The intersections create new sets, but the entry's
+        # set must be copied if it was not intersected
+        if resources.quantity < quantity:
+            return None
+        if resources is entry.resources:
+            return resources.copy()
+        return resources
 
     def check_availability(
         self, quantity: T, start_time: T, duration: T
@@ -251,21 +331,64 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             A time slot with the searched interval and resource sets available.
         """
-        index, entry = self._find_place_before(start_time)
         end_time: T = start_time + duration
-        resources: C = entry.resources.copy()
-        for entry in self._avail[index:]:
-            if entry.time >= end_time:
-                break
-            resources &= entry.resources
-            if resources.quantity < quantity:
-                resources = None
-                break
+        resources: C | None = None
+        if not self._exceeds_capacity(quantity):
+            index, entry = self._find_place_before(start_time)
+            resources = self._intersect_until(
+                entry, self._avail.islice(index + 1), quantity, end_time
+            )
 
         return self.make_slot(
-            start_time=start_time, end_time=start_time + duration, resources=resources
+            start_time=start_time, end_time=end_time, resources=resources
         )
 
+    def check_availability_batch(
+        self, quantities: List[T], start_times: List[T], durations: List[T]
+    ) -> List[TimeSlot[T, C]]:
+        """
+        Checks the resource availability for multiple requests.
+
+        This is equivalent to calling :py:meth:`check_availability` for each
+        request, but the entries are listed once for all the requests, so
+        that each request then locates its start entry by a plain bisection.
+        It suits schedulers that probe many start times at once.
+
+        Args:
+            quantities: the amount of resources required by each request
+            start_times: the start time of each request
+            durations: the duration over which each request needs the resources.
+
+        Raises:
+            ValueError: if the lists are not of the same length.
+
+        Returns:
+            A list with a time slot for each request, in the order given.
+        """
+        if not len(quantities) == len(start_times) == len(durations):
+            raise ValueError("The lists of requests must be of the same length.")
+
+        entries: List[ProfileEntry[T, C]] = list(self._avail)
+        times: List[T] = [entry.time for entry in entries]
+        slots: List[TimeSlot[T, C]] = []
+
+        for quantity, start_time, duration in zip(quantities, start_times, durations):
+            end_time: T = start_time + duration
+            resources: C | None = None
+            if not self._exceeds_capacity(quantity):
+                index = bisect_right(times, start_time) - 1
+                entry = None if index < 0 else entries[index]
+                resources = self._intersect_until(
+                    entry, self._avail.islice(index + 1), quantity, end_time
+                )
+            slots.append(
+                self.make_slot(
+                    start_time=start_time, end_time=end_time, resources=resources
+                )
+            )
+
+        return slots
+
     def find_start_time(
         self, quantity: T, ready_time: T, duration: T
     ) -> TimeSlot[T, C] | None:
@@ -283,33 +406,88 @@ class ABCProfile(ABC, Generic[T, C]):
             A time slot with the resources available or
             None if it is not possible to meet the task requirements
         """
+        if self._exceeds_capacity(quantity):
+            return None
+
         index, _ = self._find_place_before(ready_time)
-        sub_list = self._avail[index:]
+        index = max(index, 0)
+        value_ge = self._comp.value_ge
+
+        # The entries spanned by the slot of each anchor form a window that only
+        # moves forward. As intersections cannot be undone when an entry leaves
+        # the window, the window is kept as two stacks: the oldest entries hold
+        # the intersections from each of them until the newest of them, whereas
+        # the newest entries are intersected as they arrive. This way each
+        # entry is intersected a constant number of times.
+        oldest: List[C] = []
+        newest: List[C] = []
+        newest_intersect: C | None = None
+        upcoming = enumerate(self._avail.islice(index), index)
+        idx_next, next_entry = next(upcoming, (None, None))
+        next_anchor = index
+
+        for idx_out, anchor in enumerate(self._avail.islice(index), index):
+            if idx_out < next_anchor:
+                continue
 
-        for idx_out, anchor in enumerate(sub_list):
-            intersect: C = anchor.resources.copy()
-            pos_start = anchor.time
+            pos_start = max(anchor.time, ready_time)
             pos_end = pos_start + duration
-
-            idx_in = idx_out + 1
-            while idx_in < len(sub_list) and self._comp.value_ge(
-                intersect.quantity, quantity
+            while next_entry is not None and (
+                next_entry is anchor or not value_ge(next_entry.time, pos_end)
             ):
-                entry = sub_list[idx_in]
-                if self._comp.value_ge(entry.time, pos_end):
+                resources = next_entry.resources
+                if not value_ge(resources.quantity, quantity):
+                    # No slot can include an entry that lacks the resources
+                    # so the next anchor to consider is the entry after it
+                    oldest.clear()
+                    newest.clear()
+                    newest_intersect = None
+                    next_anchor = idx_next + 1
+                    idx_next, next_entry = next(upcoming, (None, None))
                     break
 
-                intersect &= entry.resources
-                idx_in += 1
+                newest.append(resources)
+                newest_intersect = (
+                    resources
+                    if newest_intersect is None
+                    else newest_intersect & resources
+                )
+                idx_next, next_entry = next(upcoming, (None, None))
 
-            in_quantity = intersect.quantity
-            if self._comp.value_ge(in_quantity, quantity):
+            if idx_out < next_anchor:
+                continue
+
+            if not oldest:
+                intersect = newest_intersect
+            elif newest_intersect is None:
+                intersect = oldest[-1]
+            else:
+                intersect = oldest[-1] & newest_intersect
+
+            if value_ge(intersect.quantity, quantity):
+                # The intersections create new sets, but the
+                # anchor's set must be copied if it was not intersected
+                if intersect is anchor.resources:
+                    intersect = intersect.copy()
                 return self.make_slot(
                     start_time=pos_start,
-                    end_time=pos_start + duration,
+                    end_time=pos_end,
                     resources=intersect,
                 )
 
+            # The anchor leaves the window, which first requires moving
+            # the newest entries to the oldest if there are none of the latter
+            if not oldest:
+                intersect = None
+                for resources in reversed(newest):
+                    intersect = (
+                        resources if intersect is None else resources & intersect
+                    )
+                    oldest.append(intersect)
+                newest.clear()
+                newest_intersect = None
+            oldest.pop()
+
         return None
 
     def select_resources(self, resources: C, quantity: T) -> C:
@@ -350,7 +528,7 @@ class ABCProfile(ABC, Generic[T, C]):
                 selected.add(range_class(begin, end))
                 break
 
-            selected.add(copy.copy(res_range))
+            selected.add(res_range)
             curr_quantity -= res_range.quantity
 
         return selected
@@ -389,6 +567,7 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             None
         """
+        self._slots_cache.clear()
         index, start_entry = self._find_place_before(start_time)
         last_checked: ProfileEntry[T, C] = start_entry.copy(time=start_time)
 
@@ -402,9 +581,9 @@ class ABCProfile(ABC, Generic[T, C]):
             last_checked = last_checked.copy()
             index += 1
 
-        sub_list = self._avail[index:]
-        for next_entry in sub_list:
-            if self._comp.value_le(next_entry.time, end_time):
+        value_le = self._comp.value_le
+        for next_entry in self._avail.islice(index):
+            if value_le(next_entry.time, end_time):
                 last_checked.resources -= resources
                 last_checked = next_entry
             else:
@@ -416,6 +595,103 @@ class ABCProfile(ABC, Generic[T, C]):
             self._avail.add(last_checked.copy(time=end_time))
             last_checked.resources -= resources
 
+    def allocate_resources_batch(
+        self, resources: List[C], start_times: List[T], end_times: List[T]
+    ) -> None:
+        """
+        Allocates resources for multiple requests.
+
+        This is equivalent to calling :py:meth:`allocate_resources` for each
+        request, but the profile is swept once for all the requests. The
+        entries that mark the start and end times are created first, and
+        each entry then has the resources of all the requests that span
+        it removed at once.
+
+        Args:
+            resources: the sets of resources to allocate for each request
+            start_times: the start time for using each set of resources
+            end_times: the time each set of resources should be released
+
+        Raises:
+            ValueError: if the lists are not of the same length.
+
+        Returns:
+            None
+        """
+        if not len(resources) == len(start_times) == len(end_times):
+            raise ValueError("The lists of requests must be of the same length.")
+        if not resources:
+            return
+
+        self._slots_cache.clear()
+        value_eq = self._comp.value_eq
+        for time in (*start_times, *end_times):
+            _, entry = self._find_place_before(time)
+            if value_eq(entry.time, time):
+                entry.num_units += 1
+            else:
+                self._avail.add(entry.copy(time=time))
+
+        requests = sorted(
+            zip(start_times, end_times, resources), key=lambda request: request[0]
+        )
+        index, _ = self._find_place_before(requests[0][0])
+        value_le = self._comp.value_le
+        active: List[Tuple[T, C]] = []
+        next_request = 0
+
+        for entry in self._avail.islice(index):
+            while next_request < len(requests) and value_le(
+                requests[next_request][0], entry.time
+            ):
+                _, end_time, request_resources = requests[next_request]
+                active.append((end_time, request_resources))
+                next_request += 1
+
+            active = [
+                request for request in active if not value_le(request[0], entry.time)
+            ]
+            if active:
+                entry.resources = entry.resources.difference(
+                    *(request_resources for _, request_resources in active)
+                )
+            elif next_request == len(requests):
+                break
+
+    def _cached_slots(
+        self, compute: Callable[..., List[TimeSlot[T, C]]], *args: T
+    ) -> List[TimeSlot[T, C]]:
+        """
+        Obtains the slots of a query, computing them if the query is new.
+
+        The slots are kept until the profile changes, so that repeating a
+        query on an unchanged profile does not scan it again. The slots
+        returned have copies of the resource sets, hence changing them
+        leaves the kept slots intact.
+
+        Args:
+            compute: the method that computes the slots.
+            args: the arguments of the query.
+
+        Returns:
+            The list of slots.
+        """
+        # Equal arguments of different types, such as 5 and 5.0, yield
+        # slots with times of different types, hence the types are keyed too
+        key = (compute.__name__, *args, *map(type, args))
+        slots = self._slots_cache.get(key)
+        if slots is None:
+            if len(self._slots_cache) >= _SLOTS_CACHE_SIZE:
+                del self._slots_cache[next(iter(self._slots_cache))]
+            slots = compute(*args)
+            self._slots_cache[key] = slots
+
+        make_slot = self.make_slot
+        return [
+            make_slot(slot.start_time, slot.end_time, slot.resources.copy())
+            for slot in slots
+        ]
+
     def free_time_slots(self, start_time: T, end_time: T) -> List[TimeSlot]:
         """
         Gets the free time slots.
@@ -437,6 +713,9 @@ class ABCProfile(ABC, Generic[T, C]):
                     +-------------------------------------
                 Start time         Time          Finish time
 
+        The slots are kept until the profile changes, so that asking
+        again for the same period does not scan the profile again.
+
         Args:
             start_time: the start time to consider.
             end_time: the end time.
@@ -444,43 +723,56 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             A list of free time slots.
         """
+        return self._cached_slots(self._free_time_slots, start_time, end_time)
+
+    def _free_time_slots(self, start_time: T, end_time: T) -> List[TimeSlot]:
+        """Computes the free time slots of :py:meth:`free_time_slots`."""
 
         slots: List[TimeSlot] = []
-        profile: SortedKeyList[ProfileEntry] = self._clone_availability(
-            start_time, end_time
-        )
+        profile: List[ProfileEntry] = self._clone_availability(start_time, end_time)
+        num_entries = len(profile)
+        value_eq = self._comp.value_eq
 
         for idx, entry in enumerate(profile):
-            if self._comp.value_eq(entry.resources.quantity, 0):
+            if value_eq(entry.resources.quantity, 0):
                 continue
 
-            slot_start = entry.time
-            slot_start_idx = idx
-            follow_entry: C
-
-            # check all possible time slots starting at slot_start
-            while self._comp.value_gt(entry.resources.quantity, 0):
-                slot_res: C = entry.resources
-                intersection: C = slot_res
-                slot_end = end_time
-                slot_end_idx = slot_start_idx
-
-                for idx_in in range(idx + 1, len(profile)):
-                    follow_entry = profile[idx_in]
-                    intersection &= follow_entry.resources
-
-                    if self._comp.value_eq(intersection.quantity, 0):
-                        slot_end = follow_entry.time
-                        break
-
-                    slot_res = intersection
-                    slot_end_idx = idx_in
-
-                slots.append(self.make_slot(slot_start, slot_end, slot_res))
-
-                for idx_in in range(slot_start_idx, slot_end_idx + 1):
-                    follow_entry = profile[idx_in]
-                    follow_entry.resources -= slot_res
+            # The intersection at position k holds the resources available
+            # from the entry at idx until the entry at idx + k
+            intersections: List[C] = [entry.resources]
+            for idx_in in range(idx + 1, num_entries):
+                intersection = intersections[-1] & profile[idx_in].resources
+                if value_eq(intersection.quantity, 0):
+                    break
+                intersections.append(intersection)
+
+            # Each slot found takes its resources from the entries it spans and
+            # hence from the intersections. Instead of intersecting the entries
+            # again, the resources taken so far are removed from the longest
+            # intersection left, and intersections that become empty are dropped
+            removed: C = entry.resources.__class__([])
+
+            # check all possible time slots starting at the entry's time
+            while intersections:
+                slot_res: C = intersections[-1] - removed
+                if value_eq(slot_res.quantity, 0):
+                    # As the slots found next end before the entry of the
+                    # dropped intersection, the entry does not lose further
+                    # resources, so it loses those of all slots found at once
+                    if removed:
+                        last_entry = profile[idx + len(intersections) - 1]
+                        last_entry.resources -= removed
+                    intersections.pop()
+                    continue
+
+                slot_end_idx = idx + len(intersections)
+                slot_end = (
+                    profile[slot_end_idx].time
+                    if slot_end_idx < num_entries
+                    else end_time
+                )
+                slots.append(self.make_slot(entry.time, slot_end, slot_res))
+                removed |= slot_res
 
         return slots
 
@@ -496,6 +788,9 @@ class ABCProfile(ABC, Generic[T, C]):
         **NOTE:** The time slots returned by this method **OVERLAP** because they are
         the scheduling options for jobs with the provided characteristics.
 
+        The options are kept until the profile changes, so that asking
+        again with the same arguments does not scan the profile again.
+
         Args:
             start_time: the start time of the period.
             end_time: the finish time of the period.
@@ -508,54 +803,68 @@ class ABCProfile(ABC, Generic[T, C]):
         Returns:
             A list with the scheduling options.
         """
+        return self._cached_slots(
+            self._scheduling_options, start_time, end_time, min_duration, min_quantity
+        )
+
+    def _scheduling_options(
+        self, start_time: T, end_time: T, min_duration: T, min_quantity: T
+    ) -> List[TimeSlot]:
+        """Computes the scheduling options of :py:meth:`scheduling_options`."""
 
         slots: List[TimeSlot[T, C]] = []
         index, _ = self._find_place_before(start_time)
+        index = max(index, 0)
+        value_eq = self._comp.value_eq
+        value_ge = self._comp.value_ge
 
-        for index, entry in enumerate(self._avail[index:]):
-            if self._comp.value_ge(entry.time, end_time):
+        for index, entry in enumerate(self._avail.islice(index), index):
+            if value_ge(entry.time, end_time):
                 break
-            if self._comp.value_eq(entry.resources.quantity, 0):
+            if value_eq(entry.resources.quantity, 0):
                 continue
 
-            slot_res = copy.copy(entry.resources)
+            slot_res = entry.resources
             slot_start = max(entry.time, start_time)
+            # The resources of a slot are contained in those of the entries it
+            # spans, and so are the smaller resources of the slots that follow.
+            # Hence, each slot resumes the scan where the previous slot ended
+            following = self._avail.islice(index + 1)
             while slot_res is not None and slot_res.quantity > 0:
                 start_quantity = slot_res.quantity
-                changed = False
-                for next_entry in self._avail[index + 1 :]:
-                    if changed or self._comp.value_ge(next_entry.time, end_time):
+                for next_entry in following:
+                    if value_ge(next_entry.time, end_time):
                         break
                     intersection = slot_res & next_entry.resources
-                    if self._comp.value_eq(intersection.quantity, slot_res.quantity):
+                    if value_eq(intersection.quantity, slot_res.quantity):
                         continue
 
                     # if there is a change in the quantity, so that less
                     # resources are available after the next entry, then considers
                     # the next entry as the end of the current time slot
                     slot_end = min(next_entry.time, end_time)
-                    if self._comp.value_ge(
-                        slot_end - slot_start, min_duration
-                    ) and self._comp.value_ge(slot_res.quantity, min_quantity):
+                    if value_ge(slot_end - slot_start, min_duration) and value_ge(
+                        slot_res.quantity, min_quantity
+                    ):
                         slots.append(
                             self.make_slot(
                                 start_time=slot_start,
                                 end_time=slot_end,
-                                resources=copy.copy(slot_res),
+                                resources=slot_res.copy(),
                             )
                         )
-                    changed = True
                     slot_res = intersection
+                    break
 
-                if self._comp.value_eq(slot_res.quantity, start_quantity):
-                    if self._comp.value_ge(
-                        end_time - slot_start, min_duration
-                    ) and self._comp.value_ge(slot_res.quantity, min_quantity):
+                if value_eq(slot_res.quantity, start_quantity):
+                    if value_ge(end_time - slot_start, min_duration) and value_ge(
+                        slot_res.quantity, min_quantity
+                    ):
                         slots.append(
                             self.make_slot(
                                 start_time=slot_start,
                                 end_time=end_time,
-                                resources=copy.copy(slot_res),
+                                resources=slot_res.copy(),
                             )
                         )
                     slot_res = None
@@ -570,6 +879,36 @@ class ABCProfile(ABC, Generic[T, C]):
         """
         return len(self._avail)
 
+    def copy(self) -> ABCProfile[T, C]:
+        """
+        Makes a copy of this profile.
+
+        The entries and their resource sets are copied, so that allocating
+        resources in the copy leaves this profile intact. The copy is not
+        built through the constructor, hence no initial entry is created.
+
+        Returns:
+            A new profile with the same entries as this profile.
+        """
+        profile = self.__class__.__new__(self.__class__)
+        profile.__dict__.update(self.__dict__)
+        profile._slots_cache = {}
+        profile._avail = SortedKeyList(
+            (
+                ProfileEntry(
+                    entry.time,
+                    None if entry.resources is None else entry.resources.copy(),
+                    entry.num_units,
+                )
+                for entry in self._avail
+            ),
+            key=self.key_by_time(),
+        )
+        return profile
+
+    def __copy__(self):
+        return self.copy()
+
     def __repr__(self):
         return (
             f"{self.__class__.__name__}(max_capacity={self.max_capacity}, "
@@ -581,7 +920,7 @@ class DiscreteProfile(ABCProfile[int, DiscreteSet]):
     """Availability profile that handles discrete time and resources"""
 
     def __init__(self, max_capacity: int):
-        super().__init__(max_capacity=max_capacity, comparator=IntFloatComparator)
+        super().__init__(max_capacity=max_capacity, comparator=IntegerComparator)
         first_entry = ProfileEntry(
             0, DiscreteSet([DiscreteRange(0, self.max_capacity)])
         )
@@ -601,8 +940,22 @@ class ContinuousProfile(ABCProfile[float, ContinuousSet]):
     Availability profile that handles continuous time and resources (floats)
     """
 
-    def __init__(self, max_capacity: T):
-        super().__init__(max_capacity=max_capacity, comparator=IntFloatComparator)
+    def __init__(
+        self,
+        max_capacity: T,
+        comparator: Type[ABCComparator[float]] = IntFloatComparator,
+    ):
+        """
+        Creates a continuous profile.
+
+        Args:
+            max_capacity: the maximum amount of resources available.
+            comparator: the comparator for times and quantities. The default
+                compares values with a relative tolerance, whereas
+                :py:class:`~availability.util.FloatComparator` uses an
+                absolute one.
+        """
+        super().__init__(max_capacity=max_capacity, comparator=comparator)
         first_entry = ProfileEntry(
             0.0, ContinuousSet([ContinuousRange(0.0, self.max_capacity)])
         )
@@ -9,12 +9,60 @@ for discrete resources such as CPUs and nodes, whereas
 more applicable to memory resources.
 """
 
+import math
+import operator
+from typing import List, Tuple, Any, Callable, Sequence
 from spans import intrangeset, floatrangeset, intrange, floatrange
+from spans.types import Range, _internal_range
 
 __all__ = ["DiscreteRange", "ContinuousRange", "DiscreteSet", "ContinuousSet"]
 
 
-class DiscreteRange(intrange):
+# The ranges and sets rely on a few internals of `Spans`, shared by all its
+# 1.x releases, to avoid the bound objects that `Spans` creates for each
+# comparison. Ranges keep their bounds in a named tuple of the lower and upper
+# bounds, whether each bound is included and whether the range is empty, and
+# range sets keep their sorted ranges in a `_list` attribute. The slot that
+# holds the bounds is exposed below as the `_bounds` attribute of the ranges,
+# which reads it as fast as `Spans` does, so that only this section depends
+# on how `Spans` stores ranges.
+
+
+class _SpansRange:
+    """Exposes the bounds that `Spans` keeps for a range."""
+
+    __slots__ = ()
+
+    _bounds = Range.__dict__["_range"]
+
+
+def _make_range(
+    range_class: type, lower: Any, upper: Any, lower_inc: bool, upper_inc: bool
+) -> Any:
+    """
+    Creates a range from bounds that are known to be valid.
+
+    The merges of range lists compute bounds that have the right type,
+    are in order and, for discrete ranges, are already normalized by
+    `Spans` to include the lower bound only. This bypasses the checks
+    and normalization that the constructors of `Spans` perform.
+
+    Args:
+        range_class: the class of the range to create.
+        lower: the lower bound.
+        upper: the upper bound.
+        lower_inc: whether the lower bound is included.
+        upper_inc: whether the upper bound is included.
+
+    Returns:
+        A non-empty range of the given class.
+    """
+    span = range_class.__new__(range_class)
+    span._bounds = _internal_range(lower, upper, lower_inc, upper_inc, False)
+    return span
+
+
+class DiscreteRange(_SpansRange, intrange):
     """
     A range of integers.
 
@@ -59,12 +107,13 @@ class DiscreteRange(intrange):
         Returns:
             The number of resources.
         """
-        return len(self)
+        bounds = self._bounds
+        return bounds.upper - bounds.lower
 
     __slots__ = ()
 
 
-class ContinuousRange(floatrange):
+class ContinuousRange(_SpansRange, floatrange):
     """
     A range of floats.
 
@@ -92,9 +141,9 @@ class ContinuousRange(floatrange):
             TypeError: If lower or upper bound is not of the correct type.
             ValueError: If upper bound is lower than lower bound.
         """
-        if lower is not None:
+        if lower is not None and type(lower) is not float:
             lower = float(lower)
-        if upper is not None:
+        if upper is not None and type(upper) is not float:
             upper = float(upper)
         super().__init__(lower, upper, lower_inc, upper_inc)
 
@@ -106,36 +155,1043 @@ class ContinuousRange(floatrange):
         Returns:
             The amount of resources.
         """
-        return self.upper - self.lower
+        bounds = self._bounds
+        return bounds.upper - bounds.lower
 
     __slots__ = ()
 
 
-class DiscreteSet(intrangeset):
+def _is_bounded(ranges: List) -> bool:
+    """
+    Checks whether a sorted list of disjoint ranges has finite bounds.
+
+    Only the first range can lack a lower bound and only the last range
+    can lack an upper bound, so checking these two is enough.
+
+    Args:
+        ranges: the sorted list of disjoint ranges.
+
+    Returns:
+        True if all the ranges in the list have finite bounds.
+    """
+    return not ranges or (
+        ranges[0]._bounds.lower is not None and ranges[-1]._bounds.upper is not None
+    )
+
+
+def _sum_quantities(ranges: List) -> Any:
+    """
+    Sums the quantities of a list of bounded ranges.
+
+    The quantities are computed from the bounds of the ranges, which
+    avoids the properties that `Spans` evaluates to obtain each bound.
+
+    Args:
+        ranges: the list of ranges.
+
+    Returns:
+        The total quantity of resources in the ranges.
+    """
+    return sum(span._bounds.upper - span._bounds.lower for span in ranges)
+
+
+def _gallop(ranges: List, start: int, end: int, bound: Any) -> int:
+    """
+    Finds the first range whose upper bound is not smaller than the given bound.
+
+    Rather than checking the ranges one by one, the search probes positions
+    at exponentially increasing distances from `start` and then performs
+    a binary search between the last two positions probed. This makes
+    skipping `k` ranges cost `O(log k)` comparisons.
+
+    Args:
+        ranges: a sorted list of disjoint, bounded ranges.
+        start: the position from which to start the search.
+        end: the position at which to stop the search.
+        bound: the bound to search for.
+
+    Returns:
+        The position of the range found or `end` if there is no such range.
+    """
+    low, step = start, 1
+    high = start
+    while high < end and ranges[high]._bounds.upper < bound:
+        low = high + 1
+        high += step
+        step *= 2
+
+    high = min(high, end)
+    while low < high:
+        middle = (low + high) // 2
+        if ranges[middle]._bounds.upper < bound:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _intersect_unbounded(first: List, other: List) -> Tuple[List, Any]:
+    """
+    Intersects two lists of ranges, any of which can have infinite bounds.
+
+    This is the two-pointer walk of :py:func:`_intersect_ranges` relying on
+    the range comparisons of `Spans`, which handle infinite bounds.
+
+    Args:
+        first: the first sorted list of ranges.
+        other: the second sorted list of ranges.
+
+    Returns:
+        A sorted list with the ranges in both lists and the quantity of
+        resources in the ranges returned, or None if a range returned has
+        an infinite bound, so that the quantity is computed when requested.
+    """
+    result = []
+    quantity = 0
+    idx_first, idx_other = 0, 0
+    while idx_first < len(first) and idx_other < len(other):
+        span_first = first[idx_first]
+        span_other = other[idx_other]
+        overlap = span_first.intersection(span_other)
+        if overlap:
+            result.append(overlap)
+            if quantity is not None:
+                if overlap.lower_inf or overlap.upper_inf:
+                    quantity = None
+                else:
+                    quantity += overlap.quantity
+
+        # When both ranges end at the same point, both pointers move
+        ends_first = span_first.endsbefore(span_other)
+        if span_other.endsbefore(span_first):
+            idx_other += 1
+        if ends_first:
+            idx_first += 1
+
+    return result, quantity
+
+
+def _intersect_ranges(first: List, other: List) -> Tuple[List, Any]:
+    """
+    Intersects two lists of ranges.
+
+    Both lists must be sorted and contain disjoint ranges, as is the case
+    with the lists kept by range sets. Instead of intersecting every range
+    of one list with every range of the other, this walks the two lists
+    once with a pointer each, emitting the overlap of the current pair of
+    ranges and advancing the pointer of the range that ends first.
+    The overlap of bounded ranges is computed from their bounds, which
+    avoids the bound objects that `Spans` creates for each comparison.
+
+    Args:
+        first: the first sorted list of ranges.
+        other: the second sorted list of ranges.
+
+    Returns:
+        A sorted list with the ranges in both lists and the
+        quantity of resources in the ranges returned.
+    """
+    if not _is_bounded(first) or not _is_bounded(other):
+        return _intersect_unbounded(first, other)
+
+    result = []
+    quantity = 0
+    len_first, len_other = len(first), len(other)
+    idx_first, idx_other = 0, 0
+    while idx_first < len_first and idx_other < len_other:
+        span_first = first[idx_first]
+        lower_a, upper_a, lower_inc_a, upper_inc_a, _ = span_first._bounds
+        lower_b, upper_b, lower_inc_b, upper_inc_b, _ = other[idx_other]._bounds
+
+        # When a range ends before the other starts, skip it; if the next
+        # range of its list does the same, gallop over the ranges that do
+        if upper_a < lower_b:
+            idx_first += 1
+            if idx_first < len_first and first[idx_first]._bounds.upper < lower_b:
+                idx_first = _gallop(first, idx_first + 1, len_first, lower_b)
+            continue
+
+        if upper_b < lower_a:
+            idx_other += 1
+            if idx_other < len_other and other[idx_other]._bounds.upper < lower_a:
+                idx_other = _gallop(other, idx_other + 1, len_other, lower_a)
+            continue
+
+        # The overlap starts at the greater lower bound and finishes
+        # at the smaller upper bound, which also tells what range ends first
+        if lower_a > lower_b:
+            lower, lower_inc = lower_a, lower_inc_a
+        elif lower_b > lower_a:
+            lower, lower_inc = lower_b, lower_inc_b
+        else:
+            lower, lower_inc = lower_a, lower_inc_a and lower_inc_b
+
+        if upper_a < upper_b:
+            upper, upper_inc = upper_a, upper_inc_a
+            idx_first += 1
+        elif upper_b < upper_a:
+            upper, upper_inc = upper_b, upper_inc_b
+            idx_other += 1
+        else:
+            upper, upper_inc = upper_a, upper_inc_a and upper_inc_b
+            idx_first += 1
+            idx_other += 1
+
+        if lower < upper or (lower == upper and lower_inc and upper_inc):
+            overlap = _make_range(
+                span_first.__class__, lower, upper, lower_inc, upper_inc
+            )
+            result.append(overlap)
+            quantity += upper - lower
+
+    return result, quantity
+
+
+def _union_ranges(first: List, other: List) -> Tuple[List, Any]:
+    """
+    Combines two lists of bounded ranges.
+
+    Both lists must be sorted and contain disjoint ranges. The ranges of
+    both lists are taken in order of their lower bounds, and each range
+    is merged into the previous one when they overlap or touch. This
+    takes a single pass, instead of inserting the ranges one at a time.
+    Once a list is exhausted, the remaining ranges of the other list
+    that do not overlap the last range are copied at once.
+
+    Args:
+        first: the first sorted list of bounded ranges.
+        other: the second sorted list of bounded ranges.
+
+    Returns:
+        A sorted list with the ranges in any of the lists and the
+        quantity of resources in the ranges returned.
+    """
+    result = []
+    quantity = 0
+    len_first, len_other = len(first), len(other)
+    idx_first, idx_other = 0, 0
+    # The range being extended, which is None once its bounds change
+    current = None
+    lower = upper = lower_inc = upper_inc = None
+
+    while idx_first < len_first and idx_other < len_other:
+        # Take the range that starts first, favouring one that includes the bound
+        bounds_a, bounds_b = first[idx_first]._bounds, other[idx_other]._bounds
+        if bounds_a.lower < bounds_b.lower or (
+            bounds_a.lower == bounds_b.lower and bounds_a.lower_inc
+        ):
+            span, bounds = first[idx_first], bounds_a
+            idx_first += 1
+        else:
+            span, bounds = other[idx_other], bounds_b
+            idx_other += 1
+
+        if lower is not None and (
+            bounds.lower < upper
+            or (bounds.lower == upper and (upper_inc or bounds.lower_inc))
+        ):
+            if bounds.upper > upper:
+                upper, upper_inc = bounds.upper, bounds.upper_inc
+                current = None
+            elif bounds.upper == upper and bounds.upper_inc and not upper_inc:
+                upper_inc = True
+                current = None
+            continue
+
+        if lower is not None:
+            if current is None:
+                current = _make_range(
+                    span.__class__, lower, upper, lower_inc, upper_inc
+                )
+            result.append(current)
+            quantity += upper - lower
+        current = span
+        lower, upper, lower_inc, upper_inc, _ = bounds
+
+    rest, start = (first, idx_first) if idx_first < len_first else (other, idx_other)
+    if lower is not None:
+        # Merge the remaining ranges that overlap the range being extended
+        while start < len(rest):
+            bounds = rest[start]._bounds
+            if bounds.lower > upper or (
+                bounds.lower == upper and not (upper_inc or bounds.lower_inc)
+            ):
+                break
+            if bounds.upper > upper:
+                upper, upper_inc = bounds.upper, bounds.upper_inc
+                current = None
+            elif bounds.upper == upper and bounds.upper_inc and not upper_inc:
+                upper_inc = True
+                current = None
+            start += 1
+
+        if current is None:
+            current = _make_range(span.__class__, lower, upper, lower_inc, upper_inc)
+        result.append(current)
+        quantity += upper - lower
+
+    rest = rest[start:]
+    result.extend(rest)
+    quantity += _sum_quantities(rest)
+    return result, quantity
+
+
+def _difference_ranges(first: List, other: List) -> Tuple[List, Any]:
+    """
+    Removes the ranges of a list of bounded ranges from another.
+
+    Both lists must be sorted and contain disjoint ranges. The lists are
+    walked once with a pointer each, splitting each range of the first
+    list around the ranges of the other list that overlap it.
+
+    Args:
+        first: the sorted list of bounded ranges to remove ranges from.
+        other: the sorted list of bounded ranges to remove.
+
+    Returns:
+        A sorted list with the ranges in the first list but not in
+        the other, and the quantity of resources in the ranges returned.
+    """
+    result = []
+    quantity = 0
+    len_other = len(other)
+    idx_other = 0
+
+    for span in first:
+        lower, upper, lower_inc, upper_inc, _ = span._bounds
+
+        # Skip the ranges that end before this range starts
+        while idx_other < len_other:
+            bounds = other[idx_other]._bounds
+            if bounds.upper > lower or (
+                bounds.upper == lower and bounds.upper_inc and lower_inc
+            ):
+                break
+            idx_other += 1
+
+        # Split the range around the ranges that start before it ends
+        consumed = False
+        idx_in = idx_other
+        while idx_in < len_other:
+            bounds = other[idx_in]._bounds
+            if bounds.lower > upper or (
+                bounds.lower == upper and not (bounds.lower_inc and upper_inc)
+            ):
+                break
+
+            if lower < bounds.lower or (
+                lower == bounds.lower and lower_inc and not bounds.lower_inc
+            ):
+                result.append(
+                    _make_range(
+                        span.__class__,
+                        lower,
+                        bounds.lower,
+                        lower_inc,
+                        not bounds.lower_inc,
+                    )
+                )
+                quantity += bounds.lower - lower
+
+            # A range that ends after this one can overlap the next range
+            if bounds.upper > upper or (
+                bounds.upper == upper and (bounds.upper_inc or not upper_inc)
+            ):
+                consumed = True
+                break
+            lower, lower_inc = bounds.upper, not bounds.upper_inc
+            idx_in += 1
+
+        if consumed:
+            continue
+        if idx_in == idx_other:
+            result.append(span)
+            quantity += upper - lower
+        elif lower < upper or (lower == upper and lower_inc and upper_inc):
+            result.append(
+                _make_range(span.__class__, lower, upper, lower_inc, upper_inc)
+            )
+            quantity += upper - lower
+        idx_other = idx_in
+
+    return result, quantity
+
+
+# Discrete sets whose ranges lie within [0, _MASK_LIMIT) can be represented as
+# bitmasks, in which bit ``i`` is set when resource ``i`` is in the set
+_MASK_LIMIT = 1 << 14
+
+# Sets that exceed _MASK_LIMIT are also represented as bitmasks when they have
+# at least one range per _MASK_BITS_PER_RANGE bits, as operating on such large
+# masks is then still faster than merging their lists of ranges
+_MASK_BITS_PER_RANGE = 1 << 10
+
+# Large bitmasks are split into chunks of this many bytes to find their ranges
+_MASK_CHUNK_BYTES = 1 << 7
+_FULL_CHUNK = (1 << (8 * _MASK_CHUNK_BYTES)) - 1
+
+try:
+    _popcount = int.bit_count  # Python 3.10+
+except AttributeError:
+
+    def _popcount(mask: int) -> int:
+        """Counts the bits set in a bitmask."""
+        return bin(mask).count("1")
+
+
+def _ranges_to_mask(ranges: List) -> Any:
+    """
+    Builds the bitmask of a sorted list of disjoint discrete ranges.
+
+    Each operation on a Python integer creates a new integer, so rather
+    than setting the bits of each range of a large mask in turn, its
+    binary digits are written out and converted at once.
+
+    Args:
+        ranges: the sorted list of disjoint ranges.
+
+    Returns:
+        The bitmask as an integer or `None` if the ranges have negative
+        or infinite bounds or are too sparse for the bitmask they need.
+    """
+    if not ranges:
+        return 0
+
+    first, last = ranges[0]._bounds, ranges[-1]._bounds
+    if first.lower is None or last.upper is None or first.lower < 0:
+        return None
+
+    if last.upper >= _MASK_LIMIT:
+        if last.upper > len(ranges) * _MASK_BITS_PER_RANGE:
+            return None
+
+        digits = []
+        previous = 0
+        for span in ranges:
+            lower, upper, lower_inc, upper_inc, _ = span._bounds
+            lower += not lower_inc
+            upper += upper_inc
+            digits.append("0" * (lower - previous))
+            digits.append("1" * (upper - lower))
+            previous = upper
+        return int("".join(digits)[::-1], 2)
+
+    mask = 0
+    for span in ranges:
+        lower, upper, lower_inc, upper_inc, _ = span._bounds
+        lower += not lower_inc
+        upper += upper_inc
+        mask |= ((1 << (upper - lower)) - 1) << lower
+    return mask
+
+
+def _mask_to_ranges(mask: int) -> List:
+    """
+    Builds the sorted list of discrete ranges of a bitmask.
+
+    Each run of consecutive set bits becomes a range. As shifting a mask
+    copies it, large masks are split into chunks whose runs are found
+    separately, joining the runs that continue across chunks.
+
+    Args:
+        mask: the bitmask.
+
+    Returns:
+        The sorted list of disjoint ranges.
+    """
+    if mask.bit_length() <= _MASK_LIMIT:
+        chunks = [(0, mask)]
+    else:
+        data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+        chunks = [
+            (
+                8 * start,
+                int.from_bytes(data[start : start + _MASK_CHUNK_BYTES], "little"),
+            )
+            for start in range(0, len(data), _MASK_CHUNK_BYTES)
+        ]
+
+    bounds = []
+    for position, chunk in chunks:
+        if chunk == _FULL_CHUNK:
+            chunk_end = position + 8 * _MASK_CHUNK_BYTES
+            if bounds and bounds[-1][1] == position:
+                bounds[-1][1] = chunk_end
+            else:
+                bounds.append([position, chunk_end])
+            continue
+
+        while chunk:
+            # Skip the unset bits, then measure the run of set bits that follows
+            zeros = (chunk & -chunk).bit_length() - 1
+            chunk >>= zeros
+            position += zeros
+            ones = (chunk ^ (chunk + 1)).bit_length() - 1
+            if bounds and bounds[-1][1] == position:
+                bounds[-1][1] = position + ones
+            else:
+                bounds.append([position, position + ones])
+            chunk >>= ones
+            position += ones
+
+    return [
+        _make_range(DiscreteRange, lower, upper, True, False) for lower, upper in bounds
+    ]
+
+
+class _RangeSet:
+    """
+    Set operations shared by the discrete and continuous sets.
+
+    The operations inherited from `Spans` add ranges one at a time to the
+    resulting set. As the ranges of a set are kept sorted and disjoint,
+    the operations here build the resulting list of ranges in a single pass.
+
+    The quantity of resources in a set is computed once and kept in
+    the `_quantity` slot of the subclasses until the set is modified.
+    Operations whose other operands are empty or the set itself return
+    a copy of the set or an empty set without merging any ranges.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, ranges):
+        self._quantity = None
+        super().__init__(ranges)
+
+    @classmethod
+    def _from_list(cls, ranges: List, quantity: Any = None):
+        """
+        Creates a set from a sorted list of disjoint ranges.
+
+        The ranges are not validated, hence this is meant for ranges
+        produced by operations on other sets.
+
+        Args:
+            ranges: the sorted list of disjoint ranges.
+            quantity: the quantity of resources in the ranges, if known.
+
+        Returns:
+            A new set containing the ranges.
+        """
+        new_set = cls.__new__(cls)
+        new_set._list = ranges
+        new_set._quantity = quantity
+        return new_set
+
+    def copy(self):
+        """
+        Makes a copy of this set.
+
+        The copy shares the ranges with this set as ranges are immutable,
+        and it is built from the list of ranges without adding them again.
+
+        Returns:
+            A new set with the same ranges as this set.
+        """
+        return self._from_list(list(self._list), self._quantity)
+
+    __copy__ = copy
+
+    def _clear_cache(self) -> None:
+        """Discards the values computed from the ranges before modifying them."""
+        self._quantity = None
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._quantity = None
+
+    def add(self, item) -> None:
+        """
+        Adds a range to the set, updating the set in place.
+
+        Args:
+            item: the range to add to this set.
+
+        Raises:
+            TypeError: If the given range is of incorrect type.
+        """
+        self._clear_cache()
+        super().add(item)
+
+    def remove(self, item) -> None:
+        """
+        Removes a range from the set, updating the set in place.
+
+        Args:
+            item: the range to remove from this set.
+        """
+        self._clear_cache()
+        super().remove(item)
+
+    def _trivial_result(
+        self, others: Tuple, empty_absorbs: bool, self_absorbs: bool
+    ) -> Any:
+        """
+        Obtains the result of an operation whose operands make it trivial.
+
+        The result is empty when an absorbing operand is found. Otherwise,
+        when the other operands are all empty or this set itself, the
+        result is a copy of this set. Neither requires a merge or bitmask.
+
+        Args:
+            others: the other sets of the operation.
+            empty_absorbs: whether an empty set makes the result empty.
+            self_absorbs: whether this set makes the result empty.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the result or `None` if the operation is not trivial.
+        """
+        for other in others:
+            self._test_rangeset_type(other)
+
+        trivial = True
+        for other in others:
+            if other is self:
+                if self_absorbs:
+                    return self._from_list([], 0)
+            elif not other:
+                if empty_absorbs:
+                    return self._from_list([], 0)
+            else:
+                trivial = False
+        return self.copy() if trivial else None
+
+    def _merge(self, merge_ranges: Callable, others: Tuple):
+        """
+        Applies a merge of range lists to this set and each of the given sets.
+
+        Args:
+            merge_ranges: the function merging two lists of bounded ranges.
+            others: the sets to merge with this set.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the result or `None` if any of the sets has
+            infinite bounds, which the merges do not handle.
+        """
+        ranges, quantity = self._list, self._quantity
+        for other in others:
+            self._test_rangeset_type(other)
+        for other in others:
+            if not _is_bounded(ranges) or not _is_bounded(other._list):
+                return None
+            ranges, quantity = merge_ranges(ranges, other._list)
+
+        if ranges is self._list:
+            ranges = list(ranges)
+        return self._from_list(ranges, quantity)
+
+    def union(self, *others):
+        """
+        Returns a new set with the ranges that exist in this or any given set.
+
+        Sets with infinite bounds are combined by `Spans`, which adds the
+        ranges of the other sets one at a time to a copy of the first set,
+        so the set with most ranges is the one copied.
+
+        Args:
+            others: the sets to combine with this set.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the union.
+        """
+        result = self._trivial_result(others, False, False)
+        if result is None:
+            result = self._merge(_union_ranges, others)
+        if result is not None:
+            return result
+
+        largest = self
+        for other in others:
+            if type(other) is type(self) and len(other._list) > len(largest._list):
+                largest = other
+        if largest is self:
+            return super().union(*others)
+        rest = [self] + [other for other in others if other is not largest]
+        return super(_RangeSet, largest).union(*rest)
+
+    def difference(self, *others):
+        """
+        Returns a new set with the ranges of this set that exist in no given set.
+
+        Args:
+            others: the sets whose ranges are removed from this set.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the difference.
+        """
+        result = self._trivial_result(others, False, True)
+        if result is None:
+            result = self._merge(_difference_ranges, others)
+        return super().difference(*others) if result is None else result
+
+    def intersection(self, *others):
+        """
+        Returns a new set with the ranges that exist in this and every given set.
+
+        Args:
+            others: the sets to intersect this set with.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the intersection.
+        """
+        result = self._trivial_result(others, True, False)
+        if result is not None:
+            return result
+
+        ranges, quantity = self._list, self._quantity
+        for other in others:
+            if not ranges:
+                break
+            ranges, quantity = _intersect_ranges(ranges, other._list)
+
+        if ranges is self._list:
+            ranges = list(ranges)
+        return self._from_list(ranges, quantity)
+
+    def __and__(self, other):
+        # Only an operand of another type is not supported, whereas the errors
+        # raised when intersecting two sets are left to reach the caller
+        if not self.is_valid_rangeset(other):
+            return NotImplemented
+        return self.intersection(other)
+
+
+class DiscreteSet(_RangeSet, intrangeset):
     """
     A set of discrete ranges.
 
     Similar to ranges, range sets support union, difference, and intersection.
     Contrary to Python’s built-in sets, the operations return a new
     set and do not modify the range set in place since ranges are immutable.
+
+    Sets of resources identified from ``0`` to a few thousand, and larger
+    sets split into many ranges, are also represented as bitmasks, computed
+    when first needed. The union, difference, and intersection of such sets
+    are bitwise operations and the ranges of the resulting set are only
+    built when used, so that checking its quantity is a population count.
     """
 
-    __slots__ = ()
+    __slots__ = ("_quantity", "_ranges", "_mask")
+
+    # Replaces the list of ranges kept by `Spans`, so that sets created from a
+    # bitmask build their ranges the first time `Spans` accesses them
+    @property
+    def _list(self) -> List:
+        if self._ranges is None:
+            self._ranges = _mask_to_ranges(self._mask)
+        return self._ranges
+
+    @_list.setter
+    def _list(self, ranges: List) -> None:
+        self._ranges = ranges
+        self._mask = None
+
+    @classmethod
+    def from_arrays(cls, lowers: Sequence[int], uppers: Sequence[int]):
+        """
+        Creates a set from the bounds of its ranges.
+
+        The bounds at position ``i`` give the range ``[lowers[i], uppers[i])``.
+        The ranges can be in any order and overlap, as they are sorted and
+        merged in a single pass, instead of adding them one at a time::
+
+            >>> DiscreteSet.from_arrays([5, 0, 2], [8, 3, 4])
+            DiscreteSet([DiscreteRange(0, 4), DiscreteRange(5, 8)])
+
+        Args:
+            lowers: the lower bounds, which are included in the ranges.
+            uppers: the upper bounds, which are not included in the ranges.
+
+        Raises:
+            TypeError: If a bound is not an integer.
+            ValueError: If the numbers of lower and upper bounds differ
+                        or an upper bound is lower than its lower bound.
+
+        Returns:
+            A new set with the ranges.
+        """
+        if len(lowers) != len(uppers):
+            raise ValueError("The numbers of lower and upper bounds differ.")
+
+        bounds = zip(map(operator.index, lowers), map(operator.index, uppers))
+        ranges = []
+        quantity = 0
+        lower = upper = None
+        for next_lower, next_upper in sorted(bounds):
+            if next_upper < next_lower:
+                raise ValueError(
+                    f"Upper bound ({next_upper}) is less than "
+                    f"lower bound ({next_lower})"
+                )
+            if next_lower == next_upper:
+                continue
+            if lower is not None and next_lower <= upper:
+                upper = max(upper, next_upper)
+                continue
+            if lower is not None:
+                ranges.append(_make_range(cls.type, lower, upper, True, False))
+                quantity += upper - lower
+            lower, upper = next_lower, next_upper
+
+        if lower is not None:
+            ranges.append(_make_range(cls.type, lower, upper, True, False))
+            quantity += upper - lower
+        return cls._from_list(ranges, quantity)
+
+    @classmethod
+    def _from_mask(cls, mask: int):
+        """
+        Creates a set from a bitmask.
+
+        Args:
+            mask: the bitmask with the resources in the set.
+
+        Returns:
+            A new set whose ranges are built from the bitmask when needed.
+        """
+        new_set = cls.__new__(cls)
+        new_set._ranges = None
+        new_set._mask = mask
+        new_set._quantity = None
+        return new_set
+
+    def _get_mask(self) -> Any:
+        """
+        Obtains the bitmask of this set, computing it if needed.
+
+        Returns:
+            The bitmask or `None` if this set cannot be represented as one.
+        """
+        if self._mask is None:
+            self._mask = _ranges_to_mask(self._ranges)
+        return self._mask
+
+    def _clear_cache(self) -> None:
+        """Discards the values computed from the ranges before modifying them."""
+        # Builds the ranges, if needed, as the bitmask no longer matches them
+        self._list = self._list
+        self._quantity = None
+
+    def copy(self):
+        """
+        Makes a copy of this set, including its bitmask if already computed.
+
+        Returns:
+            A new set with the same ranges as this set.
+        """
+        new_set = self._from_mask(self._mask)
+        if self._ranges is not None:
+            new_set._ranges = list(self._ranges)
+        new_set._quantity = self._quantity
+        return new_set
+
+    __copy__ = copy
+
+    def _get_masks(self, others: Tuple) -> Any:
+        """
+        Obtains the bitmasks of this set and the given sets.
+
+        Args:
+            others: the sets whose bitmasks are also needed.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A list with the bitmasks or `None` if any of the sets
+            cannot be represented as a bitmask.
+        """
+        for other in others:
+            self._test_rangeset_type(other)
+
+        masks = [self._get_mask()]
+        for other in others:
+            if masks[-1] is None:
+                return None
+            masks.append(other._get_mask())
+        return None if masks[-1] is None else masks
+
+    def union(self, *others):
+        """
+        Returns a new set with the ranges that exist in this or any given set.
+
+        When all the sets can be represented as bitmasks, the union
+        is computed from them.
+
+        Args:
+            others: the sets to combine with this set.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the union.
+        """
+        result = self._trivial_result(others, False, False)
+        if result is not None:
+            return result
+
+        masks = self._get_masks(others)
+        if masks is None:
+            return super().union(*others)
+
+        mask = masks[0]
+        for other_mask in masks[1:]:
+            mask |= other_mask
+        return self._from_mask(mask)
+
+    def difference(self, *others):
+        """
+        Returns a new set with the ranges of this set that exist in no given set.
+
+        When all the sets can be represented as bitmasks, the difference
+        is computed from them.
+
+        Args:
+            others: the sets whose ranges are removed from this set.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the difference.
+        """
+        result = self._trivial_result(others, False, True)
+        if result is not None:
+            return result
+
+        masks = self._get_masks(others)
+        if masks is None:
+            return super().difference(*others)
+
+        mask = masks[0]
+        for other_mask in masks[1:]:
+            mask &= ~other_mask
+        return self._from_mask(mask)
+
+    def intersection(self, *others):
+        """
+        Returns a new set with the ranges that exist in this and every given set.
+
+        When all the sets can be represented as bitmasks, the intersection
+        is computed from them.
+
+        Args:
+            others: the sets to intersect this set with.
+
+        Raises:
+            TypeError: If any of the given sets is not of the type of this set.
+
+        Returns:
+            A new set with the intersection.
+        """
+        result = self._trivial_result(others, True, False)
+        if result is not None:
+            return result
+
+        masks = self._get_masks(others)
+        if masks is None:
+            return super().intersection(*others)
+
+        mask = masks[0]
+        for other_mask in masks[1:]:
+            mask &= other_mask
+        return self._from_mask(mask)
+
+    def contains(self, item) -> bool:
+        """
+        Checks whether a range or a resource is in this set.
+
+        As the ranges are sorted and disjoint, the only range that can
+        contain the item is the first one that ends at or after it, which
+        is found by a binary search instead of testing every range. Sets
+        created from a bitmask test the bits of the item instead, without
+        building their ranges.
+
+        Args:
+            item: the range or resource to check.
+
+        Raises:
+            ValueError: If the item is neither a range nor an integer.
+
+        Returns:
+            True if the item is contained within this set.
+        """
+        if self.is_valid_range(item):
+            if not item:
+                return True
+            lower, upper, *_ = item._bounds
+        elif self.is_valid_scalar(item):
+            lower, upper = item, item + 1
+        else:
+            return super().contains(item)
+
+        # Bitmasks only hold resources from 0 to a finite bound
+        if self._ranges is None:
+            if lower is None or upper is None or lower < 0:
+                return False
+            bits = (1 << (upper - lower)) - 1
+            return (self._mask >> lower) & bits == bits
+
+        ranges = self._list
+        if not _is_bounded(ranges):
+            if not self.is_valid_scalar(item):
+                return super().contains(item)
+            # `Spans` takes a resource 0 for an empty range, which every set
+            # contains, so resources are checked against the bounds instead
+            return any(
+                (span.lower_inf or span._bounds.lower <= item)
+                and (span.upper_inf or item < span._bounds.upper)
+                for span in ranges
+            )
+        if lower is None or upper is None:
+            return super().contains(item)
+        index = _gallop(ranges, 0, len(ranges), upper)
+        return index < len(ranges) and ranges[index]._bounds.lower <= lower
+
+    __contains__ = contains
+
+    def __bool__(self) -> bool:
+        if self._ranges is None:
+            return self._mask != 0
+        return bool(self._ranges)
 
     @property
     def quantity(self) -> int:
         """
-        Obtains the number of resources in the set.
+        Obtains the number of resources in the set. The number is computed
+        when first requested and kept until the set is modified.
 
         Returns:
             The number of resources.
         """
-        return sum(i.quantity for i in iter(self))
+        if self._quantity is None:
+            if self._mask is not None:
+                self._quantity = _popcount(self._mask)
+            else:
+                self._quantity = _sum_quantities(self._list)
+        return self._quantity
 
     type = DiscreteRange  # used by intrangeset
 
 
-class ContinuousSet(floatrangeset):
+class ContinuousSet(_RangeSet, floatrangeset):
     """
     A set of continuous ranges.
 
@@ -144,16 +1200,23 @@ class ContinuousSet(floatrangeset):
     set and do not modify the range set in place since ranges are immutable.
     """
 
-    __slots__ = ()
+    __slots__ = ("_quantity",)
 
     @property
     def quantity(self) -> float:
         """
-        Obtains the amount of resources in the set.
+        Obtains the amount of resources in the set. The amount is computed
+        when first requested and kept until the set is modified. The widths
+        of the ranges are summed with `math.fsum`, which does not accumulate
+        rounding errors across many ranges.
 
         Returns:
             The resource amount.
         """
-        return sum(i.quantity for i in iter(self))
+        if self._quantity is None:
+            self._quantity = math.fsum(
+                span._bounds.upper - span._bounds.lower for span in self._list
+            )
+        return self._quantity
 
     type = ContinuousRange  # used by floatrangeset
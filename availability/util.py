@@ -8,12 +8,19 @@ in ranges and sets, hence abstracting the comparison details
 away from the profile. """
 
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TypeVar, Generic, Type
+import functools
 import math
+import operator
 
 V = TypeVar("V", int, float)
 
-__all__ = ["ABCComparator", "IntFloatComparator"]
+__all__ = [
+    "ABCComparator",
+    "IntFloatComparator",
+    "IntegerComparator",
+    "FloatComparator",
+]
 
 
 class ABCComparator(ABC, Generic[V]):
@@ -119,28 +126,139 @@ class ABCComparator(ABC, Generic[V]):
 class IntFloatComparator(ABCComparator[V]):
     """
     Comparator to compare floats and integers.
+
+    The methods are static, so that calling them through the class does
+    not bind it, and they test the exact comparison first, which
+    avoids calling `math.isclose` when the values are equal. The
+    strict comparisons and `value_ne` are exact, so they are the
+    comparison functions of the `operator` module.
     """
 
-    @classmethod
-    def value_lt(cls, first: V, other: V) -> bool:
-        return first < other
+    value_lt = staticmethod(operator.lt)
 
-    @classmethod
-    def value_le(cls, first: V, other: V) -> bool:
-        return first < other or math.isclose(first, other)
+    @staticmethod
+    def value_le(first: V, other: V) -> bool:
+        return first <= other or math.isclose(first, other)
+
+    @staticmethod
+    def value_eq(first: V, other: V) -> bool:
+        return first == other or math.isclose(first, other)
+
+    @staticmethod
+    def value_ge(first: V, other: V) -> bool:
+        return first >= other or math.isclose(first, other)
+
+    value_gt = staticmethod(operator.gt)
+    value_ne = staticmethod(operator.ne)
+
+
+class IntegerComparator(ABCComparator[int]):
+    """
+    Comparator to compare integers.
+
+    As integers are compared exactly, the methods are the comparison
+    functions of the `operator` module, avoiding the tolerance
+    checks that `IntFloatComparator` performs for floats.
+    """
+
+    value_lt = staticmethod(operator.lt)
+    value_le = staticmethod(operator.le)
+    value_eq = staticmethod(operator.eq)
+    value_ge = staticmethod(operator.ge)
+    value_gt = staticmethod(operator.gt)
+    value_ne = staticmethod(operator.ne)
+
+
+class FloatComparator(ABCComparator[float]):
+    """
+    Comparator to compare floats with an absolute tolerance.
+
+    Two values are considered equal when they differ by at most
+    `tolerance`. This is a single subtraction and comparison, instead
+    of the relative tolerance that `math.isclose` computes on each call.
+    Because the tolerance is absolute, it suits values that are not
+    many orders of magnitude larger than the tolerance. As in
+    `IntFloatComparator`, the exact comparison is tested first, which
+    also handles infinite values, whose difference is not a number.
+    """
+
+    tolerance: float = 1e-9
+    """ The largest difference between two values considered equal. """
 
     @classmethod
-    def value_eq(cls, first: V, other: V) -> bool:
-        return math.isclose(first, other)
+    def with_tolerance(cls, tolerance: float) -> Type["FloatComparator"]:
+        """
+        Creates a comparator that uses another tolerance.
+
+        As the tolerance is shared by all the profiles that use this class,
+        a subclass with the given tolerance is returned instead of changing
+        it for everyone. The tolerant comparisons of the subclass are static
+        methods bound to the tolerance, so they do not look it up on each
+        call, and the subclass is created once per tolerance::
+
+            >>> comparator = FloatComparator.with_tolerance(1e-6)
+            >>> comparator.value_eq(1.0, 1.0 + 1e-7)
+            True
+
+        Args:
+            tolerance: the largest difference between two values considered equal.
+
+        Raises:
+            ValueError: If the tolerance is negative.
+
+        Returns:
+            A subclass of this comparator with the given tolerance.
+        """
+        if tolerance < 0:
+            raise ValueError("The tolerance cannot be negative.")
+        return _with_tolerance(cls, tolerance)
+
+    value_lt = staticmethod(operator.lt)
 
     @classmethod
-    def value_ge(cls, first: V, other: V) -> bool:
-        return first > other or math.isclose(first, other)
+    def value_le(cls, first: float, other: float) -> bool:
+        return first <= other or first - other <= cls.tolerance
 
     @classmethod
-    def value_gt(cls, first: V, other: V) -> bool:
-        return first > other
+    def value_eq(cls, first: float, other: float) -> bool:
+        return first == other or abs(first - other) <= cls.tolerance
 
     @classmethod
-    def value_ne(cls, first: V, other: V) -> bool:
-        return first != other
+    def value_ge(cls, first: float, other: float) -> bool:
+        return first >= other or other - first <= cls.tolerance
+
+    value_gt = staticmethod(operator.gt)
+    value_ne = staticmethod(operator.ne)
+
+
+@functools.lru_cache(maxsize=None)
+def _with_tolerance(comparator: Type[FloatComparator], tolerance: float):
+    """
+    Creates a subclass of a float comparator with the given tolerance.
+
+    Args:
+        comparator: the comparator to subclass.
+        tolerance: the largest difference between two values considered equal.
+
+    Returns:
+        The subclass, whose `value_le`, `value_eq` and `value_ge`
+        compare values with the tolerance given.
+    """
+
+    def value_le(first: float, other: float) -> bool:
+        return first <= other or first - other <= tolerance
+
+    def value_eq(first: float, other: float) -> bool:
+        return first == other or abs(first - other) <= tolerance
+
+    def value_ge(first: float, other: float) -> bool:
+        return first >= other or other - first <= tolerance
+
+    namespace = {
+        "tolerance": tolerance,
+        "value_le": staticmethod(value_le),
+        "value_eq": staticmethod(value_eq),
+        "value_ge": staticmethod(value_ge),
+        "__module__": comparator.__module__,
+    }
+    return type(comparator.__name__, (comparator,), namespace)
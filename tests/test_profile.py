@@ -2,11 +2,17 @@
 # -*- coding: utf-8 -*-
 """ Tests the availability profile """
 
+import copy
 import unittest
 
 from availability.sets import DiscreteRange, ContinuousRange, DiscreteSet, ContinuousSet
-from availability.profile import DiscreteProfile, ContinuousProfile, ProfileEntry
-from availability.util import IntFloatComparator
+from availability.profile import (
+    ABCProfile,
+    DiscreteProfile,
+    ContinuousProfile,
+    ProfileEntry,
+)
+from availability.util import IntFloatComparator, IntegerComparator, FloatComparator
 
 
 class TestResourceRanges(unittest.TestCase):
@@ -48,6 +54,245 @@ class TestResourceSets(unittest.TestCase):
         spans -= DiscreteSet([DiscreteRange(10, 20)])
         self.assertEqual(spans.quantity, 10)
 
+    def test_discrete_set_contains(self) -> None:
+        """Tests finding resources and ranges in a discrete set."""
+        spans = DiscreteSet([DiscreteRange(i * 3, i * 3 + 2) for i in range(1, 100)])
+        self.assertIn(4, spans)
+        self.assertNotIn(5, spans)
+        self.assertNotIn(0, spans)
+        self.assertTrue(spans.contains(DiscreteRange(297, 299)))
+        self.assertFalse(spans.contains(DiscreteRange(297, 300)))
+        self.assertTrue(spans.contains(DiscreteRange(10, 10)))
+        self.assertIn(-5, DiscreteSet([DiscreteRange(upper=0)]))
+        unbounded = DiscreteSet([DiscreteRange(1, 3), DiscreteRange(5, None)])
+        self.assertNotIn(0, unbounded)
+        self.assertNotIn(4, unbounded)
+        self.assertIn(2, unbounded)
+        self.assertIn(10**9, unbounded)
+        self.assertNotIn(0, DiscreteSet([DiscreteRange(upper=0)]))
+        self.assertIn(DiscreteRange(6, 8), unbounded)
+        self.assertNotIn(DiscreteRange(2, 6), unbounded)
+        with self.assertRaises(ValueError):
+            spans.contains("a")
+        masked = spans & DiscreteSet([DiscreteRange(0, 20)])
+        self.assertIn(DiscreteRange(3, 5), masked)
+        self.assertNotIn(DiscreteRange(4, 6), masked)
+        self.assertNotIn(-1, masked)
+        self.assertNotIn(DiscreteRange(upper=4), masked)
+
+    def test_discrete_set_from_arrays(self) -> None:
+        """Tests creating a discrete set from the bounds of its ranges."""
+        spans = DiscreteSet.from_arrays([10, 0, 3, 7], [12, 5, 7, 7])
+        self.assertEqual(
+            spans, DiscreteSet([DiscreteRange(0, 7), DiscreteRange(10, 12)])
+        )
+        self.assertEqual(spans.quantity, 9)
+        self.assertFalse(DiscreteSet.from_arrays([], []))
+        with self.assertRaises(ValueError):
+            DiscreteSet.from_arrays([0, 1], [2])
+        with self.assertRaises(ValueError):
+            DiscreteSet.from_arrays([5], [2])
+        with self.assertRaises(TypeError):
+            DiscreteSet.from_arrays([0.5], [2])
+
+    def test_intersect_discrete_sets(self) -> None:
+        """Tests intersecting sets with multiple ranges."""
+        first = DiscreteSet(
+            [DiscreteRange(0, 5), DiscreteRange(8, 12), DiscreteRange(20, 30)]
+        )
+        other = DiscreteSet([DiscreteRange(3, 10), DiscreteRange(11, 25)])
+        expected = DiscreteSet(
+            [
+                DiscreteRange(3, 5),
+                DiscreteRange(8, 10),
+                DiscreteRange(11, 12),
+                DiscreteRange(20, 25),
+            ]
+        )
+        self.assertEqual(first & other, expected)
+        self.assertEqual(other & first, expected)
+        self.assertEqual((first & DiscreteSet([])).quantity, 0)
+        many = DiscreteSet([DiscreteRange(i * 3, i * 3 + 2) for i in range(-1, 100)])
+        few = DiscreteSet([DiscreteRange(31, 37), DiscreteRange(250, 251)])
+        expected = DiscreteSet(
+            [
+                DiscreteRange(31, 32),
+                DiscreteRange(33, 35),
+                DiscreteRange(36, 37),
+                DiscreteRange(250, 251),
+            ]
+        )
+        self.assertEqual(many & few, expected)
+        self.assertEqual(few & many, expected)
+
+    def test_intersect_bitmask_sets(self) -> None:
+        """Tests intersecting sets with and without bitmasks."""
+        first = DiscreteSet([DiscreteRange(0, 5), DiscreteRange(8, 12)])
+        negative = DiscreteSet([DiscreteRange(-5, 3), DiscreteRange(10, 20)])
+        expected = DiscreteSet([DiscreteRange(0, 3), DiscreteRange(10, 12)])
+        self.assertEqual(first & negative, expected)
+        self.assertEqual(negative & first, expected)
+        result = first & DiscreteSet([DiscreteRange(2, 10)])
+        self.assertEqual(result.quantity, 5)
+        result.add(DiscreteRange(20, 25))
+        self.assertEqual(result.quantity, 10)
+        self.assertEqual(
+            result,
+            DiscreteSet(
+                [DiscreteRange(2, 5), DiscreteRange(8, 10), DiscreteRange(20, 25)]
+            ),
+        )
+        self.assertFalse(first & DiscreteSet([DiscreteRange(5, 8)]))
+
+    def test_combine_bitmask_sets(self) -> None:
+        """Tests the union and difference of sets with and without bitmasks."""
+        first = DiscreteSet([DiscreteRange(0, 5), DiscreteRange(8, 12)])
+        other = DiscreteSet([DiscreteRange(5, 8), DiscreteRange(10, 15)])
+        negative = DiscreteSet([DiscreteRange(-5, 3)])
+        self.assertEqual(first | other, DiscreteSet([DiscreteRange(0, 15)]))
+        self.assertEqual((first | other).quantity, 15)
+        self.assertEqual(
+            first | negative,
+            DiscreteSet([DiscreteRange(-5, 5), DiscreteRange(8, 12)]),
+        )
+        self.assertEqual(
+            first - other, DiscreteSet([DiscreteRange(0, 5), DiscreteRange(8, 10)])
+        )
+        self.assertEqual((first - other).quantity, 7)
+        self.assertEqual(
+            first - negative,
+            DiscreteSet([DiscreteRange(3, 5), DiscreteRange(8, 12)]),
+        )
+        self.assertFalse(first - first)
+
+    def test_large_bitmask_sets(self) -> None:
+        """Tests combining large sets split into many ranges."""
+        lowers = list(range(0, 40000, 400))
+        first = DiscreteSet.from_arrays(lowers, [lower + 300 for lower in lowers])
+        other = DiscreteSet.from_arrays(
+            [lower + 200 for lower in lowers], [lower + 350 for lower in lowers]
+        )
+        self.assertEqual((first & other).quantity, 10000)
+        self.assertEqual((first - other).quantity, 20000)
+        union = first | other
+        self.assertEqual(union.quantity, 35000)
+        self.assertEqual(
+            union, DiscreteSet.from_arrays(lowers, [lower + 350 for lower in lowers])
+        )
+        self.assertEqual(
+            DiscreteSet([DiscreteRange(0, 40000)]) - (first - other),
+            DiscreteSet.from_arrays(
+                [lower + 200 for lower in lowers], [lower + 400 for lower in lowers]
+            ),
+        )
+
+    def test_trivial_operands(self) -> None:
+        """Tests operations with empty sets and with the set itself."""
+        for spans, empty in (
+            (DiscreteSet([DiscreteRange(0, 5), DiscreteRange(8, 12)]), DiscreteSet([])),
+            (ContinuousSet([ContinuousRange(0.0, 5.0)]), ContinuousSet([])),
+        ):
+            for result in (spans | empty, spans | spans, spans - empty, spans & spans):
+                self.assertEqual(result, spans)
+                self.assertIsNot(result, spans)
+                self.assertEqual(result.quantity, spans.quantity)
+            for result in (spans & empty, empty & spans, spans - spans):
+                self.assertFalse(result)
+            result = spans | empty
+            result.add(result.type(20, 25))
+            self.assertNotEqual(result, spans)
+
+    def test_set_quantity_updates(self) -> None:
+        """Tests that the quantity follows in-place changes to a set."""
+        spans = DiscreteSet([DiscreteRange(0, 10)])
+        self.assertEqual(spans.quantity, 10)
+        spans.add(DiscreteRange(20, 25))
+        self.assertEqual(spans.quantity, 15)
+        spans.remove(DiscreteRange(0, 5))
+        self.assertEqual(spans.quantity, 10)
+
+    def test_copy_set(self) -> None:
+        """Tests that copies do not share the ranges list with the original."""
+        spans = DiscreteSet([DiscreteRange(0, 10)])
+        for spans_copy in (spans.copy(), copy.copy(spans)):
+            self.assertEqual(spans_copy, spans)
+            spans_copy.add(DiscreteRange(20, 25))
+            self.assertEqual(spans_copy.quantity, 15)
+            self.assertEqual(spans.quantity, 10)
+
+    def test_combine_continuous_sets(self) -> None:
+        """Tests the union and difference of continuous sets."""
+        first = ContinuousSet(
+            [ContinuousRange(0.0, 5.0), ContinuousRange(8.0, 12.0, upper_inc=True)]
+        )
+        other = ContinuousSet(
+            [
+                ContinuousRange(5.0, 6.0, lower_inc=False),
+                ContinuousRange(12.0, 15.0, lower_inc=False),
+            ]
+        )
+        self.assertEqual(
+            first | other,
+            ContinuousSet(
+                [
+                    ContinuousRange(0.0, 5.0),
+                    ContinuousRange(5.0, 6.0, lower_inc=False),
+                    ContinuousRange(8.0, 15.0),
+                ]
+            ),
+        )
+        self.assertEqual((first | other).quantity, 13.0)
+        self.assertEqual(
+            first - ContinuousSet([ContinuousRange(4.0, 9.0, upper_inc=True)]),
+            ContinuousSet(
+                [
+                    ContinuousRange(0.0, 4.0),
+                    ContinuousRange(9.0, 12.0, lower_inc=False, upper_inc=True),
+                ]
+            ),
+        )
+        self.assertEqual((first - other).quantity, first.quantity)
+        self.assertFalse(first - first)
+        longer = ContinuousSet([ContinuousRange(8.0, 20.0)])
+        self.assertEqual(
+            first | longer,
+            ContinuousSet([ContinuousRange(0.0, 5.0), ContinuousRange(8.0, 20.0)]),
+        )
+        self.assertEqual((longer | first).quantity, 17.0)
+
+    def test_union_unbounded_sets(self) -> None:
+        """Tests the union of sets with infinite bounds."""
+        unbounded = DiscreteSet([DiscreteRange(upper=0)])
+        many = DiscreteSet([DiscreteRange(i * 3, i * 3 + 2) for i in range(-2, 5)])
+        expected = DiscreteSet(
+            [DiscreteRange(upper=2)]
+            + [DiscreteRange(i * 3, i * 3 + 2) for i in range(1, 5)]
+        )
+        self.assertEqual(unbounded | many, expected)
+        self.assertEqual(many | unbounded, expected)
+        self.assertIsInstance(unbounded | many, DiscreteSet)
+        self.assertEqual(list(unbounded), [DiscreteRange(upper=0)])
+
+    def test_intersect_unbounded_sets(self) -> None:
+        """Tests the intersection of sets with infinite bounds."""
+        first = DiscreteSet([DiscreteRange(upper=5)])
+        other = DiscreteSet([DiscreteRange(upper=3)])
+        expected = DiscreteSet([DiscreteRange(upper=3)])
+        self.assertEqual(first & other, expected)
+        self.assertEqual(first.intersection(other), expected)
+        bounded = DiscreteSet([DiscreteRange(-2, 1), DiscreteRange(4, 8)])
+        result = first & bounded
+        expected = DiscreteSet([DiscreteRange(-2, 1), DiscreteRange(4, 5)])
+        self.assertEqual(result, expected)
+        self.assertEqual(result.quantity, 4)
+        first = ContinuousSet([ContinuousRange(upper=5.0)])
+        other = ContinuousSet([ContinuousRange(upper=3.0)])
+        expected = ContinuousSet([ContinuousRange(upper=3.0)])
+        self.assertEqual(first & other, expected)
+        self.assertEqual(first.intersection(other), expected)
+        with self.assertRaises(TypeError):
+            first & 5.0
+
     def test_create_continuous_set(self) -> None:
         """Tests a few operations of continuous sets."""
         spans = ContinuousSet([ContinuousRange(0.0, 10.0)])
@@ -77,9 +322,21 @@ class TestProfileEntry(unittest.TestCase):
 class TestDiscreteProfile(unittest.TestCase):
     """Tests the discrete availability profile."""
 
+    FULL = DiscreteSet([DiscreteRange(0, 10)])
+    SPAN1 = DiscreteSet([DiscreteRange(2, 7)])
+    SPAN2 = DiscreteSet([DiscreteRange(0, 2)])
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.max_capacity = 10
+        cls.pristine = DiscreteProfile(max_capacity=cls.max_capacity)
+        cls.allocated = cls.pristine.copy()
+        cls.allocated.allocate_resources_batch(
+            [cls.SPAN1, cls.SPAN2], start_times=[5, 0], end_times=[10, 5]
+        )
+
     def setUp(self) -> None:
-        self.max_capacity = 10
-        self.profile = DiscreteProfile(max_capacity=self.max_capacity)
+        self.profile = self.pristine.copy()
 
     def tearDown(self) -> None:
         del self.profile
@@ -91,20 +348,43 @@ class TestDiscreteProfile(unittest.TestCase):
         self.assertEqual(slot.start_time, 0)
         self.assertEqual(slot.end_time, 1)
         self.assertEqual(slot.resources.quantity, self.max_capacity)
+        self.assertIsNone(self.profile.find_start_time(self.max_capacity + 1, 0, 1))
+        slot = self.profile.check_availability(self.max_capacity + 1, 0, 1)
+        self.assertEqual((slot.start_time, slot.end_time), (0, 1))
+        self.assertIsNone(slot.resources)
+
+    def test_profile_without_capacity(self) -> None:
+        """Tests a profile created without a maximum capacity"""
+
+        class Profile(ABCProfile):
+            make_slot = staticmethod(DiscreteProfile.make_slot)
+
+        profile = Profile(comparator=IntegerComparator)
+        profile.add_entry(ProfileEntry(0, DiscreteSet([DiscreteRange(0, 8)])))
+        self.assertIsNone(profile.max_capacity)
+        self.assertEqual(profile.find_start_time(8, 0, 1).resources.quantity, 8)
+        slot = profile.check_availability(8, 0, 1)
+        self.assertEqual(slot.resources.quantity, 8)
+        slots = profile.check_availability_batch([8, 9], [0, 0], [1, 1])
+        self.assertEqual(slots[0].resources.quantity, 8)
+        self.assertIsNone(slots[1].resources)
 
     def test_find_start_time(self):
         """Tests finding the start time for a task"""
         slot = self.profile.find_start_time(quantity=5, ready_time=0, duration=10)
         self.assertEqual(slot.start_time, 0)
         self.assertEqual(slot.end_time, 10)
-        self.assertEqual(
-            slot.resources, DiscreteSet([DiscreteRange(0, self.max_capacity)])
-        )
+        self.assertEqual(slot.resources, self.FULL)
         self._allocate()
         slot = self.profile.find_start_time(quantity=5, ready_time=0, duration=10)
         self.assertEqual(slot.start_time, 5)
         self.assertEqual(slot.end_time, 15)
         self.assertIn(DiscreteRange(7, 10), slot.resources)
+        slot = self.profile.find_start_time(quantity=8, ready_time=2, duration=2)
+        self.assertEqual(slot.start_time, 2)
+        self.assertEqual(slot.end_time, 4)
+        slot = self.profile.find_start_time(quantity=8, ready_time=2, duration=4)
+        self.assertEqual(slot.start_time, 10)
 
     def test_selecting_resources(self):
         """Tests selecting resources from a slot"""
@@ -115,10 +395,12 @@ class TestDiscreteProfile(unittest.TestCase):
         slot = self.profile.find_start_time(quantity=5, ready_time=0, duration=10)
         resources = self.profile.select_resources(resources=slot.resources, quantity=5)
         self.assertEqual(resources.quantity, 5)
-        self.assertRaises(ValueError, self.profile.select_resources, resources, 15)
+        with self.assertRaises(ValueError):
+            self.profile.select_resources(resources, 15)
         resources = self.profile.select_slot_resources(slot=slot, quantity=5)
         self.assertEqual(resources.quantity, 5)
-        self.assertRaises(ValueError, self.profile.select_slot_resources, slot, 15)
+        with self.assertRaises(ValueError):
+            self.profile.select_slot_resources(slot, 15)
         slot = self.profile.find_start_time(quantity=10, ready_time=5, duration=2)
         self.assertEqual(slot.start_time, 10)
         # Try selecting from None
@@ -129,25 +411,25 @@ class TestDiscreteProfile(unittest.TestCase):
             self.profile.select_resources(resources=None, quantity=5)
 
     def _allocate(self) -> None:
-        """Allocates a few resources from the pool"""
-        span1 = DiscreteSet([DiscreteRange(2, 7)])
-        span2 = DiscreteSet([DiscreteRange(0, 2)])
-        self.profile.allocate_resources(resources=span1, start_time=5, end_time=10)
-        self.profile.allocate_resources(resources=span2, start_time=0, end_time=5)
+        """Replaces the profile with a copy of the one with resources allocated"""
+        self.profile = self.allocated.copy()
 
     def test_time_slots(self) -> None:
         """Tests obtaining the free time slots in the pool"""
         self._allocate()
         slots = self.profile.free_time_slots(start_time=0, end_time=20)
-        self.assertEqual(len(slots), 4)
-        self.assertEqual(0, slots[0].start_time)
-        self.assertEqual(20, slots[0].end_time)
-        self.assertIn(DiscreteRange(7, 10), slots[0].resources)
-        self.assertIn(DiscreteRange(2, 7), slots[1].resources)
-        self.assertIn(DiscreteRange(0, 2), slots[2].resources)
-        self.assertIn(DiscreteRange(2, 7), slots[3].resources)
-        self.assertEqual(10, slots[3].start_time)
-        self.assertEqual(20, slots[3].end_time)
+        expected = [
+            (0, 20, DiscreteRange(7, 10)),
+            (0, 5, DiscreteRange(2, 7)),
+            (5, 20, DiscreteRange(0, 2)),
+            (10, 20, DiscreteRange(2, 7)),
+        ]
+        self.assertEqual(len(slots), len(expected))
+        for slot, (start_time, end_time, span) in zip(slots, expected):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                self.assertEqual(slot.start_time, start_time)
+                self.assertEqual(slot.end_time, end_time)
+                self.assertIn(span, slot.resources)
         slots = self.profile.free_time_slots(start_time=0, end_time=5)
         self.assertEqual(len(slots), 3)
 
@@ -158,31 +440,144 @@ class TestDiscreteProfile(unittest.TestCase):
         slot = self.profile.check_availability(5, start_time=5, duration=5)
         self.assertEqual(slot.resources, None)
 
+    def test_allocate_batch(self) -> None:
+        """Tests allocating resources for multiple requests at once"""
+        requests = (
+            [self.SPAN1, self.SPAN2, DiscreteSet([DiscreteRange(7, 9)]), self.SPAN2],
+            [5, 0, 3, 10],
+            [10, 5, 12, 15],
+        )
+        for resources, start_time, end_time in zip(*requests):
+            self.profile.allocate_resources(resources, start_time, end_time)
+        profile = self.pristine.copy()
+        profile.allocate_resources_batch(*requests)
+        self.assertEqual(repr(profile), repr(self.profile))
+        self.assertEqual(len(profile), 6)
+        with self.assertRaises(ValueError):
+            profile.allocate_resources_batch([self.SPAN1], [0, 1], [2])
+
+    def test_check_availability_batch(self) -> None:
+        """Tests checking the availability for multiple requests at once"""
+        self._allocate()
+        requests = ([6, 3, 8, 11], [5, 0, 2, 0], [5, 10, 2, 1])
+        slots = self.profile.check_availability_batch(*requests)
+        expected = [self.profile.check_availability(*args) for args in zip(*requests)]
+        self.assertEqual(slots, expected)
+        self.assertIsNone(slots[0].resources)
+        self.assertEqual(slots[2].resources.quantity, 8)
+        with self.assertRaises(ValueError):
+            self.profile.check_availability_batch([5], [0, 1], [1])
+
+    def test_slot_resources_are_copies(self) -> None:
+        """Tests that changing the resources of a slot leaves the profile intact"""
+        for slot in (
+            self.profile.find_start_time(quantity=5, ready_time=0, duration=10),
+            self.profile.check_availability(5, start_time=0, duration=10),
+        ):
+            slot.resources.remove(DiscreteRange(0, 5))
+            slot = self.profile.check_availability(10, start_time=0, duration=10)
+            self.assertEqual(slot.resources.quantity, self.max_capacity)
+
+    def test_repeated_slot_queries(self) -> None:
+        """Tests repeating queries before and after changing the profile"""
+        self._allocate()
+        slots = self.profile.free_time_slots(start_time=0, end_time=20)
+        slots[0].resources.add(DiscreteRange(20, 30))
+        self.assertEqual(self.profile.free_time_slots(0, 20)[0].resources.quantity, 3)
+        options = self.profile.scheduling_options(0, 20, min_duration=2)
+        self.assertEqual(options, self.profile.scheduling_options(0, 20, 2))
+        span = DiscreteSet([DiscreteRange(7, 10)])
+        self.profile.allocate_resources(resources=span, start_time=0, end_time=20)
+        slots = self.profile.free_time_slots(start_time=0, end_time=20)
+        self.assertEqual(slots[0].resources, self.SPAN1)
+        self.assertNotEqual(
+            options, self.profile.scheduling_options(0, 20, min_duration=2)
+        )
+        self.profile.free_time_slots(0, 5)
+        slots = self.profile.free_time_slots(0.0, 5.0)
+        self.assertIsInstance(slots[-1].end_time, float)
+
     def test_scheduling_options(self) -> None:
         """Test obtaining the scheduling options"""
         self._allocate()
         slots = self.profile.scheduling_options(
             start_time=0, end_time=20, min_duration=2
         )
-        self.assertEqual(len(slots), 4)
-        self.assertEqual(0, slots[0].start_time)
-        self.assertEqual(5, slots[0].end_time)
-        self.assertEqual(0, slots[1].start_time)
-        self.assertEqual(20, slots[1].end_time)
-        self.assertEqual(5, slots[2].start_time)
-        self.assertEqual(20, slots[2].end_time)
-        self.assertEqual(10, slots[3].start_time)
-        self.assertEqual(20, slots[3].end_time)
-        self.assertIn(DiscreteRange(2, 10), slots[0].resources)
-        self.assertIn(DiscreteRange(7, 10), slots[1].resources)
-        self.assertIn(DiscreteRange(0, 2), slots[2].resources)
-        self.assertIn(DiscreteRange(0, 10), slots[3].resources)
+        expected = [
+            (0, 5, DiscreteRange(2, 10)),
+            (0, 20, DiscreteRange(7, 10)),
+            (5, 20, DiscreteRange(0, 2)),
+            (10, 20, DiscreteRange(0, 10)),
+        ]
+        self.assertEqual(len(slots), len(expected))
+        for slot, (start_time, end_time, span) in zip(slots, expected):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                self.assertEqual(slot.start_time, start_time)
+                self.assertEqual(slot.end_time, end_time)
+                self.assertIn(span, slot.resources)
+
+    def test_later_scheduling_options(self) -> None:
+        """Tests the scheduling options of a period after the first entries"""
+        self._allocate()
+        span = DiscreteSet([DiscreteRange(0, 3)])
+        self.profile.allocate_resources(resources=span, start_time=15, end_time=20)
+        slots = self.profile.scheduling_options(
+            start_time=10, end_time=20, min_duration=2
+        )
+        self.assertEqual(len(slots), 3)
+        self.assertEqual(slots[0].resources, self.FULL)
+        self.assertEqual(15, slots[0].end_time)
+        self.assertEqual(slots[1].resources, DiscreteSet([DiscreteRange(3, 10)]))
+        self.assertEqual(10, slots[1].start_time)
+        self.assertEqual(15, slots[2].start_time)
+
+    def test_scheduling_options_before_first_entry(self) -> None:
+        """Tests the scheduling options of a period before the first entry"""
+        span = DiscreteSet([DiscreteRange(0, 4)])
+        self.profile.allocate_resources(resources=span, start_time=5, end_time=10)
+        span = DiscreteSet([DiscreteRange(0, 2)])
+        self.profile.allocate_resources(resources=span, start_time=20, end_time=30)
+        self.profile.remove_past_entries(6)
+        slots = self.profile.scheduling_options(
+            start_time=0, end_time=40, min_duration=1
+        )
+        expected = [
+            (5, 40, DiscreteSet([DiscreteRange(4, 10)])),
+            (10, 20, self.FULL),
+            (10, 40, DiscreteSet([DiscreteRange(2, 10)])),
+            (20, 40, DiscreteSet([DiscreteRange(2, 10)])),
+            (30, 40, self.FULL),
+        ]
+        self.assertEqual(len(slots), len(expected))
+        for slot, (start_time, end_time, resources) in zip(slots, expected):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                self.assertEqual(slot.start_time, start_time)
+                self.assertEqual(slot.end_time, end_time)
+                self.assertEqual(slot.resources, resources)
 
     def test_remove_past_entries(self):
         """Tests removing past entries"""
         self._allocate()
         self.profile.remove_past_entries(earliest_time=5)
         self.assertEqual(len(self.profile), 2)
+        span = DiscreteSet([DiscreteRange(0, 2)])
+        self.profile.allocate_resources(resources=span, start_time=12, end_time=15)
+        slot = self.profile.check_availability(10, start_time=12, duration=3)
+        self.assertEqual(slot.resources, None)
+        self.assertEqual(len(self.profile), 4)
+
+    def test_copy(self) -> None:
+        """Tests that allocating resources in a copy leaves the profile intact"""
+        self._allocate()
+        profile = copy.copy(self.profile)
+        self.assertEqual(repr(profile), repr(self.profile))
+        span = DiscreteSet([DiscreteRange(7, 10)])
+        profile.allocate_resources(resources=span, start_time=5, end_time=10)
+        slot = profile.check_availability(5, start_time=5, duration=5)
+        self.assertIsNone(slot.resources)
+        slot = self.profile.check_availability(5, start_time=5, duration=5)
+        self.assertEqual(slot.resources.quantity, 5)
+        self.assertEqual(len(self.pristine), 1)
 
     def test_repr(self):
         """Tests string representation"""
@@ -198,9 +593,21 @@ class TestDiscreteProfile(unittest.TestCase):
 class TestContinuousProfile(unittest.TestCase):
     """Tests the continuous availability profile."""
 
+    FULL = ContinuousSet([ContinuousRange(0.0, 10.0)])
+    SPAN1 = ContinuousSet([ContinuousRange(2.0, 7.0)])
+    SPAN2 = ContinuousSet([ContinuousRange(0.0, 2.0)])
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.max_capacity = 10.0
+        cls.pristine = ContinuousProfile(max_capacity=cls.max_capacity)
+        cls.allocated = cls.pristine.copy()
+        cls.allocated.allocate_resources_batch(
+            [cls.SPAN1, cls.SPAN2], start_times=[5.0, 0.0], end_times=[10.0, 5.0]
+        )
+
     def setUp(self) -> None:
-        self.max_capacity = 10.0
-        self.profile = ContinuousProfile(max_capacity=self.max_capacity)
+        self.profile = self.pristine.copy()
 
     def tearDown(self) -> None:
         del self.profile
@@ -212,22 +619,20 @@ class TestContinuousProfile(unittest.TestCase):
         self.assertEqual(slot.start_time, 0.0)
         self.assertEqual(slot.end_time, 1.0)
         self.assertEqual(slot.resources.quantity, self.max_capacity)
+        # A quantity that only exceeds the capacity by a rounding error fits
+        slot = self.profile.find_start_time(self.max_capacity + 1e-12, 0.0, 1.0)
+        self.assertEqual(slot.start_time, 0.0)
 
     def _allocate(self) -> None:
-        """Allocates a few resources from the pool"""
-        span1 = ContinuousSet([ContinuousRange(2.0, 7.0)])
-        span2 = ContinuousSet([ContinuousRange(0.0, 2.0)])
-        self.profile.allocate_resources(resources=span1, start_time=5.0, end_time=10.0)
-        self.profile.allocate_resources(resources=span2, start_time=0.0, end_time=5.0)
+        """Replaces the profile with a copy of the one with resources allocated"""
+        self.profile = self.allocated.copy()
 
     def test_find_start_time(self):
         """Tests finding the start time for a task"""
         slot = self.profile.find_start_time(quantity=5.0, ready_time=0.0, duration=10.0)
         self.assertEqual(slot.start_time, 0.0)
         self.assertEqual(slot.end_time, 10.0)
-        self.assertEqual(
-            slot.resources, ContinuousSet([ContinuousRange(0.0, self.max_capacity)])
-        )
+        self.assertEqual(slot.resources, self.FULL)
         self._allocate()
         slot = self.profile.find_start_time(quantity=5.0, ready_time=0.0, duration=10.0)
         self.assertEqual(slot.start_time, 5.0)
@@ -247,24 +652,29 @@ class TestContinuousProfile(unittest.TestCase):
             resources=slot.resources, quantity=5.0
         )
         self.assertEqual(resources.quantity, 5.0)
-        self.assertRaises(ValueError, self.profile.select_resources, resources, 15.0)
+        with self.assertRaises(ValueError):
+            self.profile.select_resources(resources, 15.0)
         resources = self.profile.select_slot_resources(slot=slot, quantity=5.0)
         self.assertEqual(resources.quantity, 5.0)
-        self.assertRaises(ValueError, self.profile.select_slot_resources, slot, 15.0)
+        with self.assertRaises(ValueError):
+            self.profile.select_slot_resources(slot, 15.0)
 
     def test_time_slots(self) -> None:
         """Tests obtaining the free time slots in the pool"""
         self._allocate()
         slots = self.profile.free_time_slots(start_time=0.0, end_time=20.0)
-        self.assertEqual(len(slots), 4)
-        self.assertEqual(0.0, slots[0].start_time)
-        self.assertEqual(20.0, slots[0].end_time)
-        self.assertIn(ContinuousRange(7.0, 10.0), slots[0].resources)
-        self.assertIn(ContinuousRange(2.0, 7.0), slots[1].resources)
-        self.assertIn(ContinuousRange(0.0, 2.0), slots[2].resources)
-        self.assertIn(ContinuousRange(2.0, 7.0), slots[3].resources)
-        self.assertEqual(10.0, slots[3].start_time)
-        self.assertEqual(20.0, slots[3].end_time)
+        expected = [
+            (0.0, 20.0, ContinuousRange(7.0, 10.0)),
+            (0.0, 5.0, ContinuousRange(2.0, 7.0)),
+            (5.0, 20.0, ContinuousRange(0.0, 2.0)),
+            (10.0, 20.0, ContinuousRange(2.0, 7.0)),
+        ]
+        self.assertEqual(len(slots), len(expected))
+        for slot, (start_time, end_time, span) in zip(slots, expected):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                self.assertEqual(slot.start_time, start_time)
+                self.assertEqual(slot.end_time, end_time)
+                self.assertIn(span, slot.resources)
 
     def test_allocate(self) -> None:
         """Test multiple allocations"""
@@ -279,19 +689,18 @@ class TestContinuousProfile(unittest.TestCase):
         slots = self.profile.scheduling_options(
             start_time=0, end_time=20, min_duration=2
         )
-        self.assertEqual(len(slots), 4)
-        self.assertEqual(0, slots[0].start_time)
-        self.assertEqual(5, slots[0].end_time)
-        self.assertEqual(0, slots[1].start_time)
-        self.assertEqual(20, slots[1].end_time)
-        self.assertEqual(5, slots[2].start_time)
-        self.assertEqual(20, slots[2].end_time)
-        self.assertEqual(10, slots[3].start_time)
-        self.assertEqual(20, slots[3].end_time)
-        self.assertIn(ContinuousRange(2, 10), slots[0].resources)
-        self.assertIn(ContinuousRange(7, 10), slots[1].resources)
-        self.assertIn(ContinuousRange(0, 2), slots[2].resources)
-        self.assertIn(ContinuousRange(0, 10), slots[3].resources)
+        expected = [
+            (0, 5, ContinuousRange(2, 10)),
+            (0, 20, ContinuousRange(7, 10)),
+            (5, 20, ContinuousRange(0, 2)),
+            (10, 20, ContinuousRange(0, 10)),
+        ]
+        self.assertEqual(len(slots), len(expected))
+        for slot, (start_time, end_time, span) in zip(slots, expected):
+            with self.subTest(start_time=start_time, end_time=end_time):
+                self.assertEqual(slot.start_time, start_time)
+                self.assertEqual(slot.end_time, end_time)
+                self.assertIn(span, slot.resources)
 
     def test_remove_past_entries(self):
         """Tests removing past entries"""
@@ -299,6 +708,34 @@ class TestContinuousProfile(unittest.TestCase):
         self.profile.remove_past_entries(earliest_time=5.0)
         self.assertEqual(len(self.profile), 2)
 
+    def test_absolute_tolerance(self) -> None:
+        """Tests a profile that compares values with an absolute tolerance"""
+        profile = ContinuousProfile(
+            max_capacity=self.max_capacity, comparator=FloatComparator
+        )
+        slot = profile.find_start_time(quantity=0.1 + 0.2, ready_time=0.0, duration=1.0)
+        profile.allocate_resources(
+            profile.select_slot_resources(slot, 0.3), slot.start_time, slot.end_time
+        )
+        slot = profile.find_start_time(
+            quantity=self.max_capacity - 0.3, ready_time=0.0, duration=1.0
+        )
+        self.assertEqual(slot.start_time, 0.0)
+
+    def test_open_ended_allocations(self) -> None:
+        """Tests allocating resources until infinity with an absolute tolerance"""
+        for _ in range(2):
+            self.profile.allocate_resources(self.SPAN1, 5.0, float("inf"))
+        for comparator in FloatComparator, FloatComparator.with_tolerance(1e-6):
+            with self.subTest(tolerance=comparator.tolerance):
+                profile = ContinuousProfile(
+                    max_capacity=self.max_capacity, comparator=comparator
+                )
+                for _ in range(2):
+                    profile.allocate_resources(self.SPAN1, 5.0, float("inf"))
+                self.assertEqual(len(profile), 3)
+                self.assertEqual(repr(profile), repr(self.profile))
+
 
 class TestComparator(unittest.TestCase):
     """Tests the comparators"""
@@ -320,6 +757,54 @@ class TestComparator(unittest.TestCase):
         self.assertTrue(self.comp.value_ge(2.0001, 2.0))
         self.assertTrue(self.comp.value_ne(2.0001, 2.0))
 
+    def test_integer_comparisons(self):
+        """Tests comparisons with the integer comparator"""
+        comp = IntegerComparator
+        self.assertTrue(comp.value_lt(2, 5))
+        self.assertFalse(comp.value_lt(2, 2))
+        self.assertTrue(comp.value_le(2, 2))
+        self.assertTrue(comp.value_eq(2, 2))
+        self.assertFalse(comp.value_eq(2, 3))
+        self.assertTrue(comp.value_ge(3, 2))
+        self.assertFalse(comp.value_gt(2, 2))
+        self.assertTrue(comp.value_ne(2, 3))
+
+    def test_float_comparisons(self):
+        """Tests comparisons with the float comparators"""
+        comp = FloatComparator
+        self.assertTrue(comp.value_lt(2.0, 5.0))
+        self.assertTrue(comp.value_le(2.0, 2.0 - comp.tolerance / 2))
+        self.assertFalse(comp.value_le(2.01, 2.0))
+        self.assertTrue(comp.value_eq(0.1 + 0.2, 0.3))
+        self.assertFalse(comp.value_eq(2.0, 2.01))
+        self.assertTrue(comp.value_ge(2.0 - comp.tolerance / 2, 2.0))
+        self.assertFalse(comp.value_ge(2.0, 2.0001))
+        self.assertFalse(comp.value_gt(2.0, 2.0))
+        self.assertTrue(comp.value_le(float("inf"), float("inf")))
+        self.assertTrue(comp.value_eq(float("inf"), float("inf")))
+        self.assertTrue(comp.value_ge(float("inf"), float("inf")))
+
+        loose = FloatComparator.with_tolerance(0.01)
+        self.assertTrue(loose.value_eq(2.0, 2.005))
+        self.assertFalse(comp.value_eq(2.0, 2.005))
+        self.assertTrue(loose.value_le(2.005, 2.0))
+        self.assertFalse(loose.value_ge(2.0, 2.02))
+        self.assertEqual(loose.tolerance, 0.01)
+        self.assertTrue(loose.value_le(float("inf"), float("inf")))
+        self.assertTrue(loose.value_eq(float("inf"), float("inf")))
+        self.assertTrue(loose.value_ge(float("inf"), float("inf")))
+        self.assertIs(FloatComparator.with_tolerance(0.01), loose)
+        with self.assertRaises(ValueError):
+            FloatComparator.with_tolerance(-1.0)
+
+        comp = IntFloatComparator
+        self.assertTrue(comp.value_le(0.1 + 0.2, 0.3))
+        self.assertTrue(comp.value_le(float("inf"), float("inf")))
+        self.assertFalse(comp.value_le(2.01, 2.0))
+        self.assertTrue(comp.value_eq(0.1 + 0.2, 0.3))
+        self.assertTrue(comp.value_ge(0.3, 0.1 + 0.2))
+        self.assertFalse(comp.value_ge(2.0, 2.01))
+
 
 if __name__ == "__main__":
     unittest.main()